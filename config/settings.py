@@ -9,6 +9,8 @@ from dotenv import load_dotenv
 load_dotenv()
 
 ScreenshotFormat = Literal["png", "jpeg"]
+ExtractionImageFormat = Literal["original", "webp", "jpeg"]
+HumanSimulationMode = Literal["auto", "always", "never"]
 
 
 def _get_screenshot_format() -> ScreenshotFormat:
@@ -20,6 +22,24 @@ def _get_screenshot_format() -> ScreenshotFormat:
     return fmt  # type: ignore[return-value]
 
 
+def _get_extraction_image_format() -> ExtractionImageFormat:
+    """Get and validate the image format sent to OpenAI from environment."""
+    fmt = os.getenv("EXTRACTION_IMAGE_FORMAT", "webp")
+    valid_formats = get_args(ExtractionImageFormat)
+    if fmt not in valid_formats:
+        raise ValueError(f"EXTRACTION_IMAGE_FORMAT must be one of {valid_formats}, got: {fmt}")
+    return fmt  # type: ignore[return-value]
+
+
+def _get_human_simulation_mode() -> HumanSimulationMode:
+    """Get and validate the human simulation mode from environment."""
+    mode = os.getenv("HUMAN_SIMULATION_MODE", "auto")
+    valid_modes = get_args(HumanSimulationMode)
+    if mode not in valid_modes:
+        raise ValueError(f"HUMAN_SIMULATION_MODE must be one of {valid_modes}, got: {mode}")
+    return mode  # type: ignore[return-value]
+
+
 class Settings:
     """Centralized configuration settings for the application."""
 
@@ -32,6 +52,10 @@ class Settings:
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
     SKIP_EXTRACTION = os.getenv("SKIP_EXTRACTION", "false").lower() == "true"
+    EXTRACTION_IMAGE_FORMAT: ExtractionImageFormat = _get_extraction_image_format()
+    EXTRACTION_IMAGE_QUALITY = int(os.getenv("EXTRACTION_IMAGE_QUALITY", "80"))
+    # Use the page's schema.org Product JSON-LD instead of the vision call when it is unambiguous
+    USE_STRUCTURED_DATA = os.getenv("USE_STRUCTURED_DATA", "true").lower() == "true"
 
     # Browser configuration
     CHROME_PATH = os.getenv("CHROME_PATH", "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome")
@@ -39,15 +63,25 @@ class Settings:
     BROWSER_SLOW_MO = int(os.getenv("BROWSER_SLOW_MO", "100"))
     VIEWPORT_WIDTH = int(os.getenv("VIEWPORT_WIDTH", "1920"))
     VIEWPORT_HEIGHT = int(os.getenv("VIEWPORT_HEIGHT", "1080"))
+    BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "false").lower() == "true"
+    BLOCKED_RESOURCE_TYPES = frozenset(
+        t.strip() for t in os.getenv("BLOCKED_RESOURCE_TYPES", "media,font,other").split(",") if t.strip()
+    )
+    ASSET_CACHE = os.getenv("ASSET_CACHE", "false").lower() == "true"
+    ASSET_CACHE_PATH = Path(os.getenv("ASSET_CACHE_PATH", str(BASE_DIR / ".cache" / "assets.sqlite")))
 
     # Screenshot configuration
     SCREENSHOT_FORMAT: ScreenshotFormat = _get_screenshot_format()
     SCREENSHOT_FULL_PAGE = os.getenv("SCREENSHOT_FULL_PAGE", "false").lower() == "true"
 
+    # Human-like behavior: "auto" only adds camouflage pauses on pages/sites that showed a challenge
+    HUMAN_SIMULATION_MODE: HumanSimulationMode = _get_human_simulation_mode()
+
     # Human-like behavior delays (in milliseconds)
     MIN_ACTION_DELAY = int(os.getenv("MIN_ACTION_DELAY", "100"))
     MAX_ACTION_DELAY = int(os.getenv("MAX_ACTION_DELAY", "500"))
     PAGE_LOAD_TIMEOUT = int(os.getenv("PAGE_LOAD_TIMEOUT", "8000"))
+    PAGE_LOAD_TIMEOUT_READY = int(os.getenv("PAGE_LOAD_TIMEOUT_READY", "10000"))
 
     @classmethod
     def ensure_directories(cls) -> None:
@@ -1,14 +1,37 @@
 """Antibot detection and challenge solving utilities."""
 
-from playwright.sync_api import Page
+from typing import TYPE_CHECKING
 
 from utils import BoundingBox, HumanBehavior
 from .cloudflare_handler import CloudflareHandler
+from .dom_probes import FIRST_VISIBLE_INDEX_JS, LocatorCache
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+# Viewport boxes of the first match of each selector, read from one layout snapshot
+# (null like Playwright's bounding_box() when missing or not rendered)
+_BOUNDING_BOXES_JS = """
+    sels => sels.map(s => {
+        let el;
+        try {
+            el = document.querySelector(s);
+        } catch (e) {
+            return null;
+        }
+        if (!el) return null;
+        const r = el.getBoundingClientRect();
+        return r.width || r.height ? {x: r.x, y: r.y, width: r.width, height: r.height} : null;
+    })
+"""
 
 
 class AntibotHandler:
     """Handles antibot detection and challenge solving."""
 
+    # Prompt shown by puzzle sliders (Shein); it disappears once the puzzle is solved
+    PUZZLE_PROMPT_SELECTOR = "text='Slide to complete'"
+
     # Common antibot selectors (excluding Cloudflare - see CloudflareHandler)
     CAPTCHA_SELECTORS = {
         # reCAPTCHA
@@ -27,17 +50,86 @@ class AntibotHandler:
         "slider_track": "[class*='slider'], [class*='captcha-slider'], [class*='drag'], [class*='JJCAPTCHA'], [class*='verify-wrap']",
         "slider_handle": "[class*='slider-handle'], [class*='slider-button'], [class*='drag-handle'], [class*='geetest'], [class*='verify-btn']",
         # Puzzle captcha (Shein uses this)
-        "puzzle_captcha": "[class*='puzzle'], [class*='jigsaw'], text='Slide to complete'",
+        "puzzle_captcha": f"[class*='puzzle'], [class*='jigsaw'], {PUZZLE_PROMPT_SELECTOR}",
         # Access denied / blocked pages
         "access_denied": "body:has-text('Access Denied'), body:has-text('blocked'), body:has-text('forbidden')",
     }
 
-    def __init__(self, page: Page):
+    # Puzzle slider drag distances in pixels: fractions of an approximate 200px track (center first)
+    PUZZLE_DRAG_OFFSETS = tuple(200 * fraction for fraction in (0.65, 0.55, 0.75, 0.45, 0.85))
+
+    # Default checkbox candidates for solve_checkbox, in priority order
+    CHECKBOX_SELECTORS = (
+        CAPTCHA_SELECTORS["recaptcha_checkbox_inner"],
+        CAPTCHA_SELECTORS["human_verify_checkbox"],
+        CAPTCHA_SELECTORS["generic_robot_checkbox"],
+        "input[type='checkbox']",
+    )
+
+    # Challenge-specific checkboxes only, for page-level detection: the bare checkbox fallback
+    # above would flag every filter or newsletter checkbox as a challenge
+    ROBOT_CHECKBOX_SELECTORS = (
+        CAPTCHA_SELECTORS["recaptcha_checkbox_inner"],
+        CAPTCHA_SELECTORS["human_verify_checkbox"],
+        "input[type='checkbox'][name*='robot' i], input[type='checkbox'][id*='robot' i], "
+        "input[type='checkbox'][name*='human' i], input[type='checkbox'][id*='human' i]",
+    )
+
+    # Solver per detect_antibot flag, in priority order. has_checkbox is covered by
+    # has_human_verify (a robot checkbox sets both), so the checkbox solve runs at most once.
+    _SOLVERS = (
+        ("has_cloudflare", lambda self: self.cloudflare.solve_challenge(detected=True)),
+        ("has_recaptcha", lambda self: self.solve_checkbox(use_iframe=True)),
+        ("has_human_verify", lambda self: self.solve_checkbox()),
+        ("has_slider", lambda self: self.solve_slider()),
+        ("has_press_hold", lambda self: self.solve_press_and_hold()),
+    )
+
+    # Every detect_antibot check (Cloudflare included) evaluated in a single round-trip,
+    # each selector queried once
+    _DETECT_JS = f"""
+        (args) => {{
+            const title = document.title.toLowerCase();
+            const has = (name) => !!document.querySelector(args.selectors[name]);
+            const robotCheckbox = has('generic_robot_checkbox');
+            return {{
+                has_recaptcha: has('recaptcha_checkbox'),
+                has_hcaptcha: has('hcaptcha_checkbox'),
+                has_cloudflare: ({CloudflareHandler.IS_CHALLENGE_JS})(args.cf),
+                has_slider: has('slider_track'),
+                has_press_hold: has('press_hold_button'),
+                has_checkbox: robotCheckbox,
+                has_human_verify: robotCheckbox || has('human_verify_checkbox'),
+                is_blocked: ['access denied', 'blocked', 'forbidden'].some(t => title.includes(t)),
+            }};
+        }}
+    """
+    _DETECT_ARGS = {
+        # Only the plain-CSS entries are queried in-page
+        "selectors": CAPTCHA_SELECTORS,
+        "cf": CloudflareHandler.IS_CHALLENGE_ARGS,
+    }
+
+    def __init__(self, page: "Page"):
         """Initialize AntibotHandler with a Playwright page."""
         self.page = page
-        self.human = HumanBehavior(page)
+        self._loc = LocatorCache(page)
+        # Challenge solving keeps human-like timing in every HUMAN_SIMULATION_MODE
+        self.human = HumanBehavior(page, simulate=True)
         self.cloudflare = CloudflareHandler(page)
 
+    def _bounding_boxes(self, selectors: list[str] | tuple[str, ...]) -> list[BoundingBox | None]:
+        """
+        Get the bounding boxes of several elements in a single round-trip.
+
+        Args:
+            selectors: CSS selectors, the first match of each is measured
+
+        Returns:
+            One bounding box (or None if not found) per selector
+        """
+        return self.page.evaluate(_BOUNDING_BOXES_JS, selectors)
+
     def detect_antibot(self) -> dict:
         """
         Detect if page has antibot challenges.
@@ -57,42 +149,7 @@ class AntibotHandler:
         }
 
         try:
-            page_title = self.page.title().lower()
-
-            # Check for reCAPTCHA
-            if self.page.locator(self.CAPTCHA_SELECTORS["recaptcha_checkbox"]).count() > 0:
-                results["has_recaptcha"] = True
-
-            # Check for hCaptcha
-            if self.page.locator(self.CAPTCHA_SELECTORS["hcaptcha_checkbox"]).count() > 0:
-                results["has_hcaptcha"] = True
-
-            # Check for Cloudflare (delegated to CloudflareHandler)
-            if self.cloudflare.is_challenge_page():
-                results["has_cloudflare"] = True
-
-            # Check for slider captcha
-            if self.page.locator(self.CAPTCHA_SELECTORS["slider_track"]).count() > 0:
-                results["has_slider"] = True
-
-            # Check for press and hold
-            if self.page.locator(self.CAPTCHA_SELECTORS["press_hold_button"]).count() > 0:
-                results["has_press_hold"] = True
-
-            # Check for generic checkbox
-            if self.page.locator(self.CAPTCHA_SELECTORS["generic_robot_checkbox"]).count() > 0:
-                results["has_checkbox"] = True
-
-            # Check if page is blocked
-            if any(term in page_title for term in ["access denied", "blocked", "forbidden"]):
-                results["is_blocked"] = True
-
-            # Check for human verification
-            if self.page.locator(self.CAPTCHA_SELECTORS["human_verify_checkbox"]).count() > 0:
-                results["has_human_verify"] = True
-            elif self.page.locator(self.CAPTCHA_SELECTORS["generic_robot_checkbox"]).count() > 0:
-                results["has_human_verify"] = True
-
+            results.update(self.page.evaluate(self._DETECT_JS, self._DETECT_ARGS))
         except Exception:
             pass
 
@@ -110,28 +167,23 @@ class AntibotHandler:
             True if checkbox was found and clicked
         """
         try:
-            selectors_to_try = [selector] if selector else [
-                self.CAPTCHA_SELECTORS["recaptcha_checkbox_inner"],
-                self.CAPTCHA_SELECTORS["human_verify_checkbox"],
-                self.CAPTCHA_SELECTORS["generic_robot_checkbox"],
-                "input[type='checkbox']",
-            ]
+            selectors_to_try = [selector] if selector else self.CHECKBOX_SELECTORS
 
-            # Access via iframe or directly
+            # Access via iframe (locators cross the frame boundary) or measure all candidates at once
             if use_iframe:
                 container = self.page.frame_locator(self.CAPTCHA_SELECTORS["recaptcha_checkbox"])
+                boxes = (
+                    container.locator(sel).first.bounding_box() if container.locator(sel).count() > 0 else None
+                    for sel in selectors_to_try
+                )
             else:
-                container = self.page
-
-            for sel in selectors_to_try:
-                if sel and container.locator(sel).count() > 0:
-                    checkbox = container.locator(sel).first
-                    box = checkbox.bounding_box()
+                boxes = self._bounding_boxes(selectors_to_try)
 
-                    if box:
-                        self.human.click_box(box)
-                        self.human.wait_for_ready()
-                        return True
+            for box in boxes:
+                if box:
+                    self.human.click_box(box)
+                    self.human.wait_for_ready()
+                    return True
 
         except Exception:
             pass
@@ -151,15 +203,12 @@ class AntibotHandler:
         """
         try:
             sel = selector or self.CAPTCHA_SELECTORS["press_hold_button"]
-            button = self.page.locator(sel).first
+            [box] = self._bounding_boxes([sel])
 
-            if button.count() > 0:
-                box = button.bounding_box()
-
-                if box:
-                    self.human.click_box(box, hold=True, hold_duration=hold_duration)
-                    self.human.wait_for_ready()
-                    return True
+            if box:
+                self.human.click_box(box, hold=True, hold_duration=hold_duration)
+                self.human.wait_for_ready()
+                return True
 
         except Exception:
             pass
@@ -181,12 +230,8 @@ class AntibotHandler:
             track_sel = track_selector or self.CAPTCHA_SELECTORS["slider_track"]
             handle_sel = handle_selector or self.CAPTCHA_SELECTORS["slider_handle"]
 
-            # Find track and handle
-            track = self.page.locator(track_sel).first
-            handle = self.page.locator(handle_sel).first
-
-            track_box = track.bounding_box() if track.count() > 0 else None
-            handle_box = handle.bounding_box() if handle.count() > 0 else None
+            # Find track and handle (same layout snapshot, in case the slider animates)
+            track_box, handle_box = self._bounding_boxes([track_sel, handle_sel])
 
             if track_box and handle_box:
                 # End position (track end with some margin)
@@ -213,21 +258,19 @@ class AntibotHandler:
         Returns:
             True if puzzle was solved or all positions were tried
         """
-        track_width = 200  # Approximate width in pixels
-        offset_attempts = [0.65, 0.55, 0.75, 0.45, 0.85]  # Positions to try (center first)
-
         # Calculate start_x for end position calculation
         start_x = handle_box["x"] + handle_box["width"] / 2
 
-        for offset_percent in offset_attempts:
-            end_x = start_x + track_width * offset_percent
-            self.human.drag(handle_box, end_x)
-            self.human.wait_for_ready()
+        for offset_px in self.PUZZLE_DRAG_OFFSETS:
+            self.human.drag(handle_box, start_x + offset_px)
 
-            # Check if puzzle was solved (slider might disappear)
-            if self.page.locator("text='Slide to complete'").count() == 0:
+            # Check if puzzle was solved: returns as soon as the slider prompt disappears
+            try:
+                self._loc(self.PUZZLE_PROMPT_SELECTOR).wait_for(state="hidden", timeout=800)
                 print("    Puzzle slider solved!")
                 return True
+            except Exception:
+                continue
 
         return True
 
@@ -241,7 +284,7 @@ class AntibotHandler:
         """
         try:
             # Check for puzzle slider text
-            has_puzzle = self.page.locator("text='Slide to complete'").count() > 0
+            has_puzzle = self._loc(self.PUZZLE_PROMPT_SELECTOR).count() > 0
 
             if not has_puzzle:
                 return False
@@ -258,18 +301,14 @@ class AntibotHandler:
                 "div[class*='drag']",
             ]
 
-            handle = None
-            for sel in handle_selectors:
-                loc = self.page.locator(sel)
-                if loc.count() > 0:
-                    first = loc.first
-                    if first.is_visible():
-                        handle = first
-                        break
+            handle_box = None
+            index = self.page.evaluate(FIRST_VISIBLE_INDEX_JS, handle_selectors)
+            if index >= 0:
+                handle_box = self._loc(handle_selectors[index]).first.bounding_box()
 
-            if not handle:
+            if not handle_box:
                 # Fallback: Look for any draggable element in the puzzle area
-                handle = self.page.evaluate("""
+                handle_box = self.page.evaluate("""
                     () => {
                         const candidates = document.querySelectorAll('[class*="slider"], [class*="drag"], [class*="verify"]');
                         for (const el of candidates) {
@@ -282,13 +321,9 @@ class AntibotHandler:
                         return null;
                     }
                 """)
-                if handle:
-                    return self._try_puzzle_drag_positions(handle)
 
-            if handle:
-                handle_box = handle.bounding_box()
-                if handle_box:
-                    return self._try_puzzle_drag_positions(handle_box)
+            if handle_box:
+                return self._try_puzzle_drag_positions(handle_box)
 
         except Exception as e:
             print(f"    Puzzle slider error: {e}")
@@ -304,24 +339,9 @@ class AntibotHandler:
             True if a challenge was solved
         """
         detection = self.detect_antibot()
+        if not any(detection.values()):
+            return False
 
-        if detection["has_cloudflare"] and self.cloudflare.solve_challenge():
-            return True
-
-        if detection["has_recaptcha"] and self.solve_checkbox(use_iframe=True):
-            return True
-
-        if detection["has_human_verify"] and self.solve_checkbox():
-            return True
-
-        if detection["has_slider"] and self.solve_slider():
-            return True
-
-        if detection["has_press_hold"] and self.solve_press_and_hold():
-            return True
-
-        if detection["has_checkbox"] and self.solve_checkbox():
-            return True
-
-        return False
+        # First successful solver wins, as with the original if-chain
+        return any(solve(self) for flag, solve in self._SOLVERS if detection[flag])
 
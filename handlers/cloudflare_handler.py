@@ -1,9 +1,14 @@
 """Cloudflare challenge detection and solving utilities."""
 
-from playwright.sync_api import Page
+import time
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 from utils import BoundingBox, HumanBehavior
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
 
 class CloudflareHandler:
     """Handles Cloudflare challenge detection and solving."""
@@ -16,10 +21,87 @@ class CloudflareHandler:
         "turnstile_clickable": "[class*='cf-turnstile'] input, [class*='cf-turnstile'] [role='checkbox'], #challenge-stage input, .cf-turnstile-wrapper input",
     }
 
-    def __init__(self, page: Page):
+    # Turnstile widget lookups, in priority order (see _probe_turnstile)
+    TURNSTILE_IFRAME_SELECTORS = (
+        "iframe[src*='challenges.cloudflare.com'][src*='turnstile']",
+        "iframe[id^='cf-chl-widget']",
+        "iframe[src*='challenges.cloudflare.com']",
+    )
+    TURNSTILE_CONTAINER_SELECTORS = (
+        "div[style*='display: grid']",
+        "div[style*='grid']",
+        "[class*='turnstile']",
+        "[class*='cf-']",
+        "[id*='turnstile']",
+    )
+    # Descendants betraying a widget host (replaces lower-casing each candidate's innerHTML)
+    TURNSTILE_HINT_SELECTOR = (
+        "[class*='turnstile' i], [id*='turnstile' i], [class*='cf-'], [id*='cf-'], "
+        "[src*='challenge'], [name*='challenge'], [id*='challenge' i]"
+    )
+    TURNSTILE_RESPONSE_SELECTOR = "input[name='cf-turnstile-response'], input[id*='cf-chl-widget'][id*='_response']"
+
+    # Older label-based checkboxes, one selector per known label text
+    LABEL_CHECKBOX_SELECTORS = tuple(
+        f"label:has-text('{text}') input[type='checkbox']"
+        for text in ("Verify you are human", "Vérifiez que vous êtes humain", "I am human")
+    )
+
+    # Page titles shown by Cloudflare interstitials
+    TITLE_INDICATORS = ("just a moment", "attention required", "one more step")
+
+    # Challenge scripts/iframes injected by Cloudflare
+    CHALLENGE_ELEMENT_SELECTOR = "script[src*='challenge-platform'], iframe[src*='challenges.cloudflare.com']"
+
+    # Challenge-page check as one in-page function (embedded by the AntibotHandler/BasePage probes)
+    IS_CHALLENGE_JS = """
+        (args) => {
+            const title = document.title.toLowerCase();
+            return args.titles.some(t => title.includes(t)) ||
+                !!document.querySelector(args.selector) ||
+                [...document.querySelectorAll('code')].some(c => c.textContent.includes('Ray ID')) ||
+                (document.body ? document.body.innerText : '').includes('Verify you are human');
+        }
+    """
+    IS_CHALLENGE_ARGS = {"titles": list(TITLE_INDICATORS), "selector": CHALLENGE_ELEMENT_SELECTOR}
+
+    # Widgets whose disappearance means the challenge has been passed
+    CHALLENGE_WIDGET_SELECTOR = f"{SELECTORS['checkbox_iframe']}, {SELECTORS['turnstile']}, .cf-turnstile"
+
+    # Seconds an is_challenge_page result stays valid for an unchanged URL
+    PROBE_TTL = 1.0
+
+    # Main-frame navigation counters shared by every handler built on the same page
+    _page_navigations: "WeakKeyDictionary[Page, list[int]]" = WeakKeyDictionary()
+
+    def __init__(self, page: "Page"):
         """Initialize CloudflareHandler with a Playwright page."""
         self.page = page
-        self.human = HumanBehavior(page)
+        # Challenge solving keeps human-like timing in every HUMAN_SIMULATION_MODE
+        self.human = HumanBehavior(page, simulate=True)
+
+        # is_challenge_page results by (URL, main-frame navigation count): (monotonic time, result)
+        self._probe_cache: dict[tuple[str, int], tuple[float, bool]] = {}
+        self._navigations = self._navigation_counter(page)
+
+    @classmethod
+    def _navigation_counter(cls, page: "Page") -> list[int]:
+        """
+        Get the page's main-frame navigation counter (reloads included).
+
+        One framenavigated listener is registered per page, however many
+        handlers are built on it; the counter lives as long as the page.
+        """
+        counter = cls._page_navigations.get(page)
+        if counter is None:
+            counter = cls._page_navigations[page] = [0]
+
+            def on_frame_navigated(frame) -> None:
+                if frame.parent_frame is None:
+                    counter[0] += 1
+
+            page.on("framenavigated", on_frame_navigated)
+        return counter
 
     def is_challenge_page(self) -> bool:
         """
@@ -28,26 +110,21 @@ class CloudflareHandler:
         Returns:
             True if this is a Cloudflare challenge page
         """
-        try:
-            page_title = self.page.title().lower()
-
-            # Check for common Cloudflare challenge page indicators
-            title_indicators = ["just a moment", "attention required", "one more step"]
-            if any(indicator in page_title for indicator in title_indicators):
-                return True
-
-            # Check for Cloudflare-specific elements
-            has_cf_ray = self.page.locator("code:has-text('Ray ID')").count() > 0
-            has_cf_script = self.page.locator("script[src*='challenge-platform']").count() > 0
-            has_verify_text = self.page.locator("text='Verify you are human'").count() > 0
-            has_turnstile_iframe = self.page.locator("iframe[src*='challenges.cloudflare.com']").count() > 0
-
-            return has_cf_ray or has_cf_script or has_verify_text or has_turnstile_iframe
+        key = (self.page.url, self._navigations[0])
+        now = time.monotonic()
+        cached = self._probe_cache.get(key)
+        if cached and now - cached[0] < self.PROBE_TTL:
+            return cached[1]
 
+        try:
+            result = bool(self.page.evaluate(self.IS_CHALLENGE_JS, self.IS_CHALLENGE_ARGS))
         except Exception:
             return False
 
-    def solve_challenge(self, max_attempts: int = 3, wait_after_solve: float = 5.0) -> bool:
+        self._probe_cache[key] = (now, result)
+        return result
+
+    def solve_challenge(self, max_attempts: int = 3, wait_after_solve: float = 5.0, detected: bool = False) -> bool:
         """
         Full solution for Cloudflare challenge pages.
 
@@ -57,11 +134,12 @@ class CloudflareHandler:
         Args:
             max_attempts: Maximum number of attempts to solve the challenge
             wait_after_solve: Seconds to wait after clicking the checkbox
+            detected: Skip the initial check when the caller has just detected the challenge
 
         Returns:
             True if the challenge was solved and page redirected
         """
-        if not self.is_challenge_page():
+        if not detected and not self.is_challenge_page():
             return False
 
         print("    Cloudflare challenge page detected, attempting to solve...")
@@ -72,10 +150,11 @@ class CloudflareHandler:
                 if self.solve_turnstile():
                     print(f"    Turnstile clicked (attempt {attempt + 1})")
 
-                    # Wait for the verification to complete
-                    self.human.wait_for_ready(timeout=int(wait_after_solve * 1000))
+                    # Return as soon as the widget is gone instead of waiting a fixed time
+                    self._wait_for_widget_gone(timeout=int(wait_after_solve * 1000))
 
-                    # Check if we're still on a challenge page
+                    # Check if we're still on a challenge page (the click may have changed it in place)
+                    self._probe_cache.clear()
                     if not self.is_challenge_page():
                         print("    Challenge solved successfully!")
                         return True
@@ -86,6 +165,23 @@ class CloudflareHandler:
         print("    Failed to solve Cloudflare challenge after max attempts")
         return False
 
+    def _wait_for_widget_gone(self, timeout: int) -> None:
+        """
+        Wait until the Turnstile widget disappears from the page.
+
+        Args:
+            timeout: Maximum wait time in milliseconds
+        """
+        try:
+            self.page.wait_for_function(
+                "sel => !document.querySelector(sel)",
+                arg=self.CHALLENGE_WIDGET_SELECTOR,
+                timeout=timeout
+            )
+        except Exception:
+            # Context destroyed by the post-challenge redirect: wait for the new page
+            self.human.wait_for_ready(timeout=timeout)
+
     def solve_turnstile(self) -> bool:
         """
         Solve Cloudflare Turnstile "Verify you are human" challenge.
@@ -97,113 +193,15 @@ class CloudflareHandler:
             True if turnstile was found and clicked
         """
         try:
-            # Strategy 1: Find the Cloudflare Turnstile iframe directly
-            turnstile_iframe = self.page.locator("iframe[src*='challenges.cloudflare.com'][src*='turnstile']")
-            if turnstile_iframe.count() > 0:
-                box = turnstile_iframe.first.bounding_box()
-                if box:
-                    return self._click_turnstile_checkbox(box)
-
-            # Strategy 2: Find iframe by id pattern (cf-chl-widget-*)
-            cf_widget_iframe = self.page.locator("iframe[id^='cf-chl-widget']")
-            if cf_widget_iframe.count() > 0:
-                box = cf_widget_iframe.first.bounding_box()
-                if box:
-                    return self._click_turnstile_checkbox(box)
-
-            # Strategy 3: Find any iframe from challenges.cloudflare.com
-            cf_challenge_iframe = self.page.locator("iframe[src*='challenges.cloudflare.com']")
-            if cf_challenge_iframe.count() > 0:
-                box = cf_challenge_iframe.first.bounding_box()
-                if box:
-                    return self._click_turnstile_checkbox(box)
-
-            # Strategy 4: Use JavaScript to find iframe in closed shadow DOM and get its position
-            iframe_info = self.page.evaluate("""
-                () => {
-                    // Look for elements that might contain the Turnstile widget
-                    const selectors = [
-                        'div[style*="display: grid"]',
-                        'div[style*="grid"]',
-                        '[class*="turnstile"]',
-                        '[class*="cf-"]',
-                        '[id*="turnstile"]'
-                    ];
-
-                    for (const selector of selectors) {
-                        const elements = document.querySelectorAll(selector);
-                        for (const el of elements) {
-                            const rect = el.getBoundingClientRect();
-                            // Turnstile widget is typically 300x65 pixels
-                            if (rect.width >= 280 && rect.width <= 320 &&
-                                rect.height >= 50 && rect.height <= 80 &&
-                                rect.top > 0 && rect.left >= 0) {
-                                return {
-                                    x: rect.x,
-                                    y: rect.y,
-                                    width: rect.width,
-                                    height: rect.height,
-                                    found: true
-                                };
-                            }
-                        }
-                    }
-
-                    // Also try to find by looking for elements with the right size
-                    const allDivs = document.querySelectorAll('div');
-                    for (const div of allDivs) {
-                        const rect = div.getBoundingClientRect();
-                        if (rect.width >= 280 && rect.width <= 320 &&
-                            rect.height >= 50 && rect.height <= 80 &&
-                            rect.top > 100 && rect.left >= 0) {
-                            // Check if it has shadow root or contains turnstile-related elements
-                            const html = div.innerHTML.toLowerCase();
-                            if (html.includes('turnstile') || html.includes('cf-') ||
-                                div.shadowRoot || html.includes('challenge')) {
-                                return {
-                                    x: rect.x,
-                                    y: rect.y,
-                                    width: rect.width,
-                                    height: rect.height,
-                                    found: true
-                                };
-                            }
-                        }
-                    }
-
-                    return { found: false };
-                }
-            """)
-
-            if iframe_info and iframe_info.get("found"):
-                return self._click_turnstile_checkbox(iframe_info)
-
-            # Strategy 5: Find the hidden input and click near it
-            hidden_input = self.page.locator("input[name='cf-turnstile-response'], input[id*='cf-chl-widget'][id*='_response']")
-            if hidden_input.count() > 0:
-                parent_box = self.page.evaluate("""
-                    () => {
-                        const input = document.querySelector("input[name='cf-turnstile-response'], input[id*='cf-chl-widget'][id*='_response']");
-                        if (input && input.parentElement) {
-                            let el = input.parentElement;
-                            for (let i = 0; i < 5 && el; i++) {
-                                const rect = el.getBoundingClientRect();
-                                if (rect.width >= 280 && rect.height >= 50) {
-                                    return { x: rect.x, y: rect.y, width: rect.width, height: rect.height, found: true };
-                                }
-                                el = el.parentElement;
-                            }
-                        }
-                        return { found: false };
-                    }
-                """)
-                if parent_box and parent_box.get("found"):
-                    return self._click_turnstile_checkbox(parent_box)
+            # Strategies 1-5 (iframes, widget-sized containers, hidden response input) in one round-trip
+            probe_box = self._probe_turnstile()
+            if probe_box:
+                return self._click_turnstile_checkbox(probe_box)
 
             # Strategy 6: Click on fixed coordinates based on typical Cloudflare layout
-            verify_text = self.page.locator("text='Verify you are human'")
+            verify_text = self.page.locator("text='Verify you are human'").first
             if verify_text.count() > 0:
-                text_box = verify_text.first.bounding_box()
+                text_box = verify_text.bounding_box()
                 if text_box:
                     widget_box: BoundingBox = {
                         "x": text_box["x"],
@@ -220,8 +218,8 @@ class CloudflareHandler:
                 return True
 
             # Strategy 8: Try finding by the label text
-            for text in ['Verify you are human', 'Vérifiez que vous êtes humain', 'I am human']:
-                checkbox = self.page.locator(f"label:has-text('{text}') input[type='checkbox']")
+            for selector in self.LABEL_CHECKBOX_SELECTORS:
+                checkbox = self.page.locator(selector)
                 if checkbox.count() > 0:
                     checkbox.click()
                     return True
@@ -231,6 +229,71 @@ class CloudflareHandler:
 
         return False
 
+    def _probe_turnstile(self) -> BoundingBox | None:
+        """
+        Locate the Turnstile widget with every in-page strategy in a single evaluate.
+
+        Strategies, in order:
+            1. Turnstile iframe from challenges.cloudflare.com
+            2. Iframe with a cf-chl-widget-* id
+            3. Any iframe from challenges.cloudflare.com
+            4. Widget-sized (~300x65) container, possibly hosting a closed shadow DOM
+            5. Widget-sized ancestor of the hidden cf-turnstile-response input
+
+        Returns:
+            Bounding box of the widget, or None if no strategy matched
+        """
+        return self.page.evaluate("""
+            (args) => {
+                const box = (rect) => ({ x: rect.x, y: rect.y, width: rect.width, height: rect.height });
+                const isWidgetSized = (rect, minTop) =>
+                    rect.width >= 280 && rect.width <= 320 &&
+                    rect.height >= 50 && rect.height <= 80 &&
+                    rect.top > minTop && rect.left >= 0;
+
+                // Strategies 1-3: the challenge iframe itself
+                for (const selector of args.iframes) {
+                    const iframe = document.querySelector(selector);
+                    if (!iframe) continue;
+                    const rect = iframe.getBoundingClientRect();
+                    if (rect.width || rect.height) return box(rect);
+                }
+
+                // Strategy 4: elements that might contain the Turnstile widget (typically 300x65 pixels)
+                for (const selector of args.containers) {
+                    for (const el of document.querySelectorAll(selector)) {
+                        const rect = el.getBoundingClientRect();
+                        if (isWidgetSized(rect, 0)) return box(rect);
+                    }
+                }
+
+                // Also try widget-sized divs hosting a shadow root or turnstile-related elements.
+                // Only size-matched candidates are inspected, via selector matching rather than
+                // serializing their innerHTML.
+                for (const div of document.querySelectorAll('div')) {
+                    const rect = div.getBoundingClientRect();
+                    if (!isWidgetSized(rect, 100)) continue;
+                    if (div.shadowRoot || div.querySelector(args.hint)) return box(rect);
+                }
+
+                // Strategy 5: widget-sized ancestor of the hidden response input
+                const input = document.querySelector(args.responseInput);
+                let el = input && input.parentElement;
+                for (let i = 0; i < 5 && el; i++) {
+                    const rect = el.getBoundingClientRect();
+                    if (rect.width >= 280 && rect.height >= 50) return box(rect);
+                    el = el.parentElement;
+                }
+
+                return null;
+            }
+        """, {
+            "iframes": self.TURNSTILE_IFRAME_SELECTORS,
+            "containers": self.TURNSTILE_CONTAINER_SELECTORS,
+            "hint": self.TURNSTILE_HINT_SELECTOR,
+            "responseInput": self.TURNSTILE_RESPONSE_SELECTOR,
+        })
+
     def _click_turnstile_checkbox(self, box: BoundingBox) -> bool:
         """
         Click on a Turnstile checkbox given its bounding box.
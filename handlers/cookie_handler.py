@@ -1,11 +1,40 @@
 """Cookie consent handling utilities."""
 
 import random
-import time
-
-from playwright.sync_api import Page
+import re
+from typing import TYPE_CHECKING
 
 from utils import HumanBehavior
+from .dom_probes import ANY_VISIBLE_JS, FIRST_VISIBLE_INDEX_JS, IS_VISIBLE_JS, PLAYWRIGHT_ONLY, LocatorCache, css_group
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+_HAS_TEXT_RE = re.compile(r"^(.*?):has-text\('([^']*)'\)(.*)$")
+
+
+def _to_probe(selector: str) -> tuple[str, str | None, bool]:
+    """
+    Translate a Playwright selector into an in-page probe.
+
+    Args:
+        selector: CSS selector, optionally with a `:has-text('...')` and/or `:visible` suffix
+
+    Returns:
+        Tuple of (plain CSS, lowercased text to contain or None, visible-only flag)
+
+    Raises:
+        ValueError: If the selector uses another Playwright-only construct
+    """
+    visible_only = selector.endswith(":visible")
+    if visible_only:
+        selector = selector[:-len(":visible")]
+    match = _HAS_TEXT_RE.match(selector)
+    css, text = (match.group(1) + match.group(3), match.group(2).lower()) if match else (selector, None)
+    # Validated once at class definition, so the in-page loop needs no per-selector error handling
+    if any(p in css for p in PLAYWRIGHT_ONLY) or css.startswith(("text=", "xpath=")) or ">>" in css:
+        raise ValueError(f"Selector cannot be probed in-page: {selector}")
+    return css, text, visible_only
 
 
 class CookieHandler:
@@ -65,6 +94,26 @@ class CookieHandler:
         "a:has-text('Accept all cookies')",
     ]
 
+    # Accept selectors as in-page probes (see _FIND_ACCEPT_JS)
+    _ACCEPT_PROBES = [_to_probe(s) for s in COOKIE_ACCEPT_SELECTORS]
+
+    # Index of the first accept selector whose first match is visible, mirroring
+    # Playwright's `locator(selector).first.is_visible()` in a single round-trip
+    _FIND_ACCEPT_JS = f"""
+        (probes) => {{
+            const isVisible = {IS_VISIBLE_JS};
+            for (let i = 0; i < probes.length; i++) {{
+                const [css, text, visibleOnly] = probes[i];
+                const el = [...document.querySelectorAll(css)].find(e =>
+                    (!text || e.textContent.replace(/\\s+/g, ' ').toLowerCase().includes(text)) &&
+                    (!visibleOnly || isVisible(e))
+                );
+                if (el && isVisible(el)) return i;
+            }}
+            return -1;
+        }}
+    """
+
     # Selectors for cookie modal/banner containers
     COOKIE_MODAL_SELECTORS = [
         "[class*='cookie-banner']",
@@ -90,21 +139,63 @@ class CookieHandler:
         "[role='dialog']:has-text('Cookie')",
     ]
 
-    def __init__(self, page: Page):
+    # Close buttons for dismissing a cookie banner without accepting
+    COOKIE_CLOSE_SELECTORS = [
+        "[class*='cookie'] button[class*='close']",
+        "[class*='cookie'] [aria-label='close']",
+        "[class*='consent'] button[class*='close']",
+        "#onetrust-close-btn-container button",
+        ".cookie-banner__close",
+    ]
+
+    # Container selectors as one CSS group, plus the Playwright-only ones probed separately
+    _COOKIE_MODAL_CSS = css_group(COOKIE_MODAL_SELECTORS)
+    _COOKIE_MODAL_FALLBACK = [s for s in COOKIE_MODAL_SELECTORS if any(p in s for p in PLAYWRIGHT_ONLY)]
+
+    # Keywords whose presence in the page text suggests a consent banner
+    COOKIE_KEYWORDS = [
+        'cookie', 'cookies', 'consent', 'gdpr', 'privacy',
+        'accept all', 'accepter', 'akzeptieren'
+    ]
+    # Keywords as one alternation: a single case-insensitive pass over the text, no lowercased copy
+    _COOKIE_KEYWORDS_PATTERN = "|".join(map(re.escape, COOKIE_KEYWORDS))
+
+    # Keyword scan and container probe in one round-trip, without serializing the DOM
+    _DETECT_JS = f"""
+        (args) => {{
+            const isVisible = {IS_VISIBLE_JS};
+            const text = document.body ? document.body.innerText : '';
+            return {{
+                hasText: new RegExp(args.keywords, 'i').test(text),
+                hasContainer: [...document.querySelectorAll(args.selector)].some(isVisible),
+            }};
+        }}
+    """
+
+    def __init__(self, page: "Page"):
         """Initialize CookieHandler with a Playwright page."""
         self.page = page
+        self._loc = LocatorCache(page)
         self.human = HumanBehavior(page)
 
     def _has_visible_element(self, selectors: list[str]) -> bool:
         """Check if any selector in the list has a visible element."""
-        for selector in selectors:
-            try:
-                if self.page.locator(selector).count() > 0:
-                    if self.page.locator(selector).first.is_visible():
-                        return True
-            except Exception:
-                continue
-        return False
+        css = css_group(selectors)
+        try:
+            if css and self.page.evaluate(ANY_VISIBLE_JS, css):
+                return True
+        except Exception:
+            pass
+
+        # Playwright-only selectors still need one locator probe each
+        try:
+            return any(
+                self._loc(selector).first.is_visible()
+                for selector in selectors
+                if any(p in selector for p in PLAYWRIGHT_ONLY)
+            )
+        except Exception:
+            return False
 
     def detect_cookie_modal(self) -> bool:
         """
@@ -114,19 +205,18 @@ class CookieHandler:
             True if a cookie modal is detected
         """
         try:
-            # Check for cookie-related text in the page
-            page_content = self.page.content().lower()
-            cookie_keywords = [
-                'cookie', 'cookies', 'consent', 'gdpr', 'privacy',
-                'accept all', 'accepter', 'akzeptieren'
-            ]
-
-            has_cookie_text = any(keyword in page_content for keyword in cookie_keywords)
-            if not has_cookie_text:
+            # Check for cookie-related text and modal/banner containers in the page
+            found = self.page.evaluate(
+                self._DETECT_JS,
+                {"keywords": self._COOKIE_KEYWORDS_PATTERN, "selector": self._COOKIE_MODAL_CSS}
+            )
+            if not found["hasText"]:
                 return False
+            if found["hasContainer"]:
+                return True
 
-            # Check for modal/banner containers
-            return self._has_visible_element(self.COOKIE_MODAL_SELECTORS)
+            # Text-based containers need Playwright's selector engine
+            return self._has_visible_element(self._COOKIE_MODAL_FALLBACK)
 
         except Exception:
             return False
@@ -138,36 +228,38 @@ class CookieHandler:
         Returns:
             True if cookies were accepted successfully
         """
-        # Try each accept selector
-        for selector in self.COOKIE_ACCEPT_SELECTORS:
+        # Find the first visible accept button in-page, then click it from Playwright
+        try:
+            index = self.page.evaluate(self._FIND_ACCEPT_JS, self._ACCEPT_PROBES)
+        except Exception:
+            index = -1
+
+        if index >= 0:
             try:
-                locator = self.page.locator(selector)
-                if locator.count() > 0:
-                    button = locator.first
-                    if button.is_visible():
-                        # Scroll into view if needed
-                        try:
-                            button.scroll_into_view_if_needed()
-                        except Exception:
-                            pass
-                        time.sleep(random.uniform(0.1, 0.2))
-
-                        # Click the button
-                        try:
-                            button.click(timeout=3000)
-                        except Exception:
-                            # Try force click if normal click fails
-                            button.click(force=True, timeout=3000)
-
-                        print("    Cookie consent accepted")
-
-                        # Some sites reload or navigate after accepting cookies
-                        self.human.wait_for_ready()
-
-                        return True
+                button = self._loc(self.COOKIE_ACCEPT_SELECTORS[index]).first
+
+                # Scroll into view if needed
+                try:
+                    button.scroll_into_view_if_needed()
+                except Exception:
+                    pass
+
+                # Click the button (press/release gap timed by Playwright, not a Python sleep)
+                try:
+                    button.click(delay=random.randint(50, 120), timeout=3000)
+                except Exception:
+                    # Try force click if normal click fails
+                    button.click(force=True, delay=random.randint(50, 120), timeout=3000)
+
+                print("    Cookie consent accepted")
+
+                # Some sites reload or navigate after accepting cookies
+                self.human.wait_for_ready()
+
+                return True
 
             except Exception:
-                continue
+                pass
 
         # Fallback: Try JavaScript-based approach for stubborn modals
         try:
@@ -209,7 +301,15 @@ class CookieHandler:
             """)
 
             if clicked:
-                time.sleep(random.uniform(0.5, 1.0))
+                # Resume as soon as the banner is gone instead of a fixed pause
+                try:
+                    self.page.wait_for_function(
+                        f"sel => !({ANY_VISIBLE_JS})(sel)",
+                        arg=self._COOKIE_MODAL_CSS,
+                        timeout=1000
+                    )
+                except Exception:
+                    pass
                 print("    Cookie consent accepted (JS fallback)")
                 return True
         except Exception:
@@ -224,21 +324,17 @@ class CookieHandler:
         Returns:
             True if modal was dismissed
         """
-        close_selectors = [
-            "[class*='cookie'] button[class*='close']",
-            "[class*='cookie'] [aria-label='close']",
-            "[class*='consent'] button[class*='close']",
-            "#onetrust-close-btn-container button",
-            ".cookie-banner__close",
-        ]
-
-        for selector in close_selectors:
-            try:
-                if self.page.locator(selector).count() > 0:
-                    self.page.locator(selector).first.click()
-                    time.sleep(random.uniform(0.3, 0.6))
-                    return True
-            except Exception:
-                continue
+        try:
+            index = self.page.evaluate(FIRST_VISIBLE_INDEX_JS, self.COOKIE_CLOSE_SELECTORS)
+            if index >= 0:
+                button = self._loc(self.COOKIE_CLOSE_SELECTORS[index]).first
+                button.click(delay=random.randint(50, 120), timeout=2000)
+                try:
+                    button.wait_for(state="hidden", timeout=500)
+                except Exception:
+                    pass
+                return True
+        except Exception:
+            pass
 
         return False
@@ -0,0 +1,76 @@
+"""In-page DOM probes and locator helpers shared by the overlay and challenge handlers."""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Locator, Page
+
+# Visibility test matching Playwright's: rendered with a non-empty box (also covers position: fixed)
+# and not visibility: hidden
+IS_VISIBLE_JS = (
+    "el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)"
+    " && getComputedStyle(el).visibility !== 'hidden'"
+)
+
+# Selector probes run in-page on a selector group: one round-trip and one DOM walk
+ANY_VISIBLE_JS = f"""
+    sel => {{
+        const isVisible = {IS_VISIBLE_JS};
+        return [...document.querySelectorAll(sel)].some(isVisible);
+    }}
+"""
+# Index of the first selector whose first match is visible (-1 if none): the in-page
+# equivalent of probing `locator(s).first.is_visible()` for each selector in order
+FIRST_VISIBLE_INDEX_JS = f"""
+    sels => {{
+        const isVisible = {IS_VISIBLE_JS};
+        return sels.findIndex(s => {{
+            const el = document.querySelector(s);
+            return !!el && isVisible(el);
+        }});
+    }}
+"""
+COUNT_VISIBLE_JS = f"""
+    sel => {{
+        const isVisible = {IS_VISIBLE_JS};
+        return [...document.querySelectorAll(sel)].filter(isVisible).length;
+    }}
+"""
+
+CLICK_FIRST_VISIBLE_JS = f"""
+    sel => {{
+        const isVisible = {IS_VISIBLE_JS};
+        const btn = [...document.querySelectorAll(sel)].find(isVisible);
+        if (!btn) return false;
+        btn.click();
+        return true;
+    }}
+"""
+
+# Playwright selector extensions that document.querySelector cannot parse
+PLAYWRIGHT_ONLY = (":has-text(", ":visible")
+
+
+def css_group(selectors: list[str]) -> str:
+    """Join the plain-CSS entries of a selector list into one selector group."""
+    return ", ".join(s for s in selectors if not any(p in s for p in PLAYWRIGHT_ONLY))
+
+
+class LocatorCache:
+    """Page locators reused across calls, keyed by selector (locators resolve lazily)."""
+
+    def __init__(self, page: "Page"):
+        """
+        Initialize LocatorCache for a Playwright page.
+
+        Args:
+            page: Playwright Page object
+        """
+        self.page = page
+        self._cache: dict[str, "Locator"] = {}
+
+    def __call__(self, selector: str) -> "Locator":
+        """Get the page locator for a selector, creating it on first use."""
+        if selector not in self._cache:
+            self._cache[selector] = self.page.locator(selector)
+        return self._cache[selector]
@@ -1,9 +1,24 @@
 """Modal popup handling utilities."""
 
-import random
-import time
+from typing import TYPE_CHECKING
 
-from playwright.sync_api import Page
+from .dom_probes import ANY_VISIBLE_JS, CLICK_FIRST_VISIBLE_JS, COUNT_VISIBLE_JS, FIRST_VISIBLE_INDEX_JS, LocatorCache, css_group
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+# Fallback close buttons: any button-like close control inside a modal-like container,
+# expanded into one selector group so the browser finds them in a single native pass
+_FALLBACK_CONTAINERS = ["[role='dialog']", "[class*='modal']", "[class*='popup']", "[class*='overlay']", "[class*='nudge']"]
+_FALLBACK_CLOSE_BUTTONS = [
+    "button[aria-label*='close' i]",
+    "[role='button'][aria-label*='close' i]",
+    "button[class*='close' i]",
+    "[role='button'][class*='close' i]",
+    "button:has(svg[class*='close'], [class*='icon-close'])",
+    "[role='button']:has(svg[class*='close'], [class*='icon-close'])",
+]
+_FALLBACK_CLOSE_CSS = ", ".join(f"{c} {b}" for c in _FALLBACK_CONTAINERS for b in _FALLBACK_CLOSE_BUTTONS)
 
 
 class ModalHandler:
@@ -62,9 +77,25 @@ class ModalHandler:
         "[class*='geolocation']",
     ]
 
-    def __init__(self, page: Page):
+    # Precompiled selector group: the browser matches every container in a single traversal
+    _MODAL_CONTAINER_CSS = css_group(MODAL_CONTAINER_SELECTORS)
+
+    def __init__(self, page: "Page"):
         """Initialize ModalHandler with a Playwright page."""
         self.page = page
+        self._loc = LocatorCache(page)
+
+    def detect_modal(self) -> bool:
+        """
+        Detect if any modal/popup container is visible on the page.
+
+        Returns:
+            True if a visible modal is detected
+        """
+        try:
+            return self.page.evaluate(ANY_VISIBLE_JS, self._MODAL_CONTAINER_CSS)
+        except Exception:
+            return False
 
     def count_modals(self) -> int:
         """
@@ -73,16 +104,10 @@ class ModalHandler:
         Returns:
             Number of visible modals detected
         """
-        count = 0
-        for selector in self.MODAL_CONTAINER_SELECTORS:
-            try:
-                locator = self.page.locator(selector)
-                for i in range(locator.count()):
-                    if locator.nth(i).is_visible():
-                        count += 1
-            except Exception:
-                continue
-        return count
+        try:
+            return self.page.evaluate(COUNT_VISIBLE_JS, self._MODAL_CONTAINER_CSS)
+        except Exception:
+            return 0
 
     def close_modal(self) -> bool:
         """
@@ -91,51 +116,38 @@ class ModalHandler:
         Returns:
             True if a modal was closed
         """
-        # Try each close selector
-        for selector in self.MODAL_CLOSE_SELECTORS:
+        # Find the first visible close button (in priority order) in one round-trip
+        try:
+            index = self.page.evaluate(FIRST_VISIBLE_INDEX_JS, self.MODAL_CLOSE_SELECTORS)
+        except Exception:
+            index = -1
+
+        if index >= 0:
             try:
-                locator = self.page.locator(selector)
-                if locator.count() > 0:
-                    button = locator.first
-                    if button.is_visible():
-                        button.click(timeout=2000)
-                        time.sleep(random.uniform(0.3, 0.6))
-                        print("    Modal closed")
-                        return True
+                button = self._loc(self.MODAL_CLOSE_SELECTORS[index]).first
+                button.click(timeout=2000)
+                # Resume as soon as the close button is gone instead of a fixed pause
+                try:
+                    button.wait_for(state="hidden", timeout=500)
+                except Exception:
+                    pass
+                print("    Modal closed")
+                return True
             except Exception:
-                continue
+                pass
 
         # Fallback: Try to find any close button in visible dialogs
         try:
-            close_clicked = self.page.evaluate("""
-                () => {
-                    // Find visible dialogs/modals
-                    const modals = document.querySelectorAll('[role="dialog"], [class*="modal"], [class*="popup"], [class*="overlay"], [class*="nudge"]');
-
-                    for (const modal of modals) {
-                        if (modal.offsetParent === null) continue; // Skip hidden
-
-                        // Look for close buttons inside
-                        const closeButtons = modal.querySelectorAll('button, [role="button"]');
-                        for (const btn of closeButtons) {
-                            const ariaLabel = (btn.getAttribute('aria-label') || '').toLowerCase();
-                            const className = (btn.className || '').toLowerCase();
-                            const isClose = ariaLabel.includes('close') ||
-                                           className.includes('close') ||
-                                           btn.querySelector('svg[class*="close"]') ||
-                                           btn.querySelector('[class*="icon-close"]');
-
-                            if (isClose && btn.offsetParent !== null) {
-                                btn.click();
-                                return true;
-                            }
-                        }
-                    }
-                    return false;
-                }
-            """)
+            close_clicked = self.page.evaluate(CLICK_FIRST_VISIBLE_JS, _FALLBACK_CLOSE_CSS)
             if close_clicked:
-                time.sleep(random.uniform(0.3, 0.6))
+                try:
+                    self.page.wait_for_function(
+                        f"sel => !({ANY_VISIBLE_JS})(sel)",
+                        arg=_FALLBACK_CLOSE_CSS,
+                        timeout=500
+                    )
+                except Exception:
+                    pass
                 print("    Modal closed (JS fallback)")
                 return True
         except Exception:
@@ -151,6 +163,7 @@ class ModalHandler:
             Number of modals closed
         """
         closed_count = 0
+        # One attempt per visible modal; a failed close moves on, so stacked modals still get tried
         for _ in range(self.count_modals()):
             if self.close_modal():
                 closed_count += 1
@@ -2,17 +2,23 @@
 
 from pathlib import Path
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from PIL import Image
-from playwright.sync_api import Page
 
 from config import Settings
 from utils.types import BoundingBox
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
 
 class ScreenshotHandler:
     """Handles screenshot capture and image manipulation."""
 
+    # Shared instances keyed by output directory (see for_output_dir)
+    _instances: dict[Path, "ScreenshotHandler"] = {}
+
     def __init__(self, output_dir: Path | None = None):
         """
         Initialize ScreenshotHandler.
@@ -23,9 +29,25 @@ class ScreenshotHandler:
         self.output_dir = output_dir or Settings.OUTPUT_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    @classmethod
+    def for_output_dir(cls, output_dir: Path | None = None) -> "ScreenshotHandler":
+        """
+        Get the shared handler for an output directory, creating it on first use.
+
+        Args:
+            output_dir: Directory to save screenshots (defaults to Settings.OUTPUT_DIR)
+
+        Returns:
+            ScreenshotHandler bound to that directory
+        """
+        key = output_dir or Settings.OUTPUT_DIR
+        if key not in cls._instances:
+            cls._instances[key] = cls(output_dir=key)
+        return cls._instances[key]
+
     def capture(
         self,
-        page: Page,
+        page: "Page",
         name: str = "screenshot",
         full_page: bool = Settings.SCREENSHOT_FULL_PAGE
     ) -> Path:
@@ -37,6 +59,36 @@ class ScreenshotHandler:
             name: Optional custom name for the screenshot
             full_page: Whether to capture full page (defaults to Settings)
 
+        Returns:
+            Path to the saved screenshot
+        """
+        return self.save_bytes(self.capture_bytes(page, full_page=full_page), name=name)
+
+    def capture_bytes(
+        self,
+        page: "Page",
+        full_page: bool = Settings.SCREENSHOT_FULL_PAGE
+    ) -> bytes:
+        """
+        Capture a screenshot from the current page without writing it to disk.
+
+        Args:
+            page: Playwright Page object
+            full_page: Whether to capture full page (defaults to Settings)
+
+        Returns:
+            Encoded image bytes
+        """
+        return page.screenshot(full_page=full_page, type=Settings.SCREENSHOT_FORMAT)
+
+    def save_bytes(self, data: bytes, name: str = "screenshot") -> Path:
+        """
+        Save already-captured screenshot bytes to the output directory.
+
+        Args:
+            data: Encoded image bytes
+            name: Optional custom name for the screenshot
+
         Returns:
             Path to the saved screenshot
         """
@@ -44,12 +96,7 @@ class ScreenshotHandler:
         filename = f"{name}_{timestamp}.{Settings.SCREENSHOT_FORMAT}"
 
         screenshot_path = self.output_dir / filename
-
-        page.screenshot(
-            path=str(screenshot_path),
-            full_page=full_page,
-            type=Settings.SCREENSHOT_FORMAT
-        )
+        screenshot_path.write_bytes(data)
 
         return screenshot_path
 
@@ -84,13 +131,16 @@ class ScreenshotHandler:
 
     def crop_element(
         self,
-        page: Page,
+        page: "Page",
         selector: str,
         name: str | None = None,
         padding: int = 0
     ) -> Path:
         """
-        Capture and crop screenshot to a specific element.
+        Capture a screenshot clipped to a specific element.
+
+        The clip is applied by the browser, so no full screenshot is taken,
+        decoded and re-encoded just to crop it.
 
         Args:
             page: Playwright Page object
@@ -107,23 +157,27 @@ class ScreenshotHandler:
         if not bounding_box:
             raise ValueError(f"Element not found or not visible: {selector}")
 
-        # Capture full page first
-        full_screenshot = self.capture(page, name=f"temp_{name or 'element'}")
-
-        # Calculate crop region with padding
-        left = max(0, int(bounding_box["x"]) - padding)
-        top = max(0, int(bounding_box["y"]) - padding)
-        right = int(bounding_box["x"] + bounding_box["width"]) + padding
-        bottom = int(bounding_box["y"] + bounding_box["height"]) + padding
+        # Calculate clip region with padding
+        left = max(0.0, bounding_box["x"] - padding)
+        top = max(0.0, bounding_box["y"] - padding)
+        clip: BoundingBox = {
+            "x": left,
+            "y": top,
+            "width": bounding_box["x"] + bounding_box["width"] + padding - left,
+            "height": bounding_box["y"] + bounding_box["height"] + padding - top,
+        }
+
+        if name:
+            output_path = self.output_dir / f"{name}.{Settings.SCREENSHOT_FORMAT}"
+        else:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = self.output_dir / f"element_{timestamp}_cropped.{Settings.SCREENSHOT_FORMAT}"
 
-        # Crop to element
-        cropped_path = self.crop(
-            full_screenshot,
-            (left, top, right, bottom),
-            output_name=name
+        page.screenshot(
+            path=str(output_path),
+            clip=clip,
+            type=Settings.SCREENSHOT_FORMAT,
+            quality=85 if Settings.SCREENSHOT_FORMAT == "jpeg" else None
         )
 
-        # Clean up temp file
-        full_screenshot.unlink(missing_ok=True)
-
-        return cropped_path
+        return output_path
@@ -1,6 +1,7 @@
 """Main orchestrator for the screenshot saver automation workflow."""
 
 import sys
+import re
 import json
 import atexit
 import signal
@@ -12,6 +13,12 @@ from config import Settings
 from utils import WordReader, TextReader, OpenAIExtractor, ChromeManager
 from pages import GenericPage
 
+# Page titles of antibot interstitials worth an auto_solve attempt
+_CHALLENGE_TITLE_RE = re.compile(
+    r"just a moment|verify|access denied|blocked|security check|challenge|captcha",
+    re.IGNORECASE
+)
+
 
 def _sigterm_handler(signum, frame):
     """Handle SIGTERM signal to ensure Chrome cleanup."""
@@ -51,20 +58,14 @@ def process_url(page, extractor: OpenAIExtractor | None, url: str, index: int, o
         # Check if we're still on a Cloudflare challenge page after navigation
         if generic_page.cloudflare.is_challenge_page():
             print("    Still on Cloudflare challenge page, retrying...")
-            if generic_page.cloudflare.solve_challenge(max_attempts=3):
+            if generic_page.cloudflare.solve_challenge(max_attempts=3, detected=True):
                 print("    Cloudflare challenge solved!")
                 generic_page.wait_for_ready()
             else:
                 print("    Warning: Could not solve Cloudflare challenge")
 
         # Only handle antibot challenges on actual challenge pages
-        page_title = generic_page.get_title().lower()
-        is_challenge_page = any(term in page_title for term in [
-            "just a moment", "verify", "access denied", "blocked",
-            "security check", "challenge", "captcha"
-        ])
-
-        if is_challenge_page:
+        if _CHALLENGE_TITLE_RE.search(generic_page.get_title()):
             print("    Antibot challenge detected, attempting to solve...")
             if generic_page.antibot.auto_solve():
                 print("    Challenge handled, waiting for page...")
@@ -246,13 +247,9 @@ def main(file_path: str | None = None) -> None:
     # Process URLs sequentially
     results = []
 
-    # Register cleanup for unexpected exits (backup for atexit)
-    atexit.register(ChromeManager.cleanup)
-
-    browser = None
     try:
         with sync_playwright() as playwright:
-            browser, page = GenericPage.create_browser_context(playwright)
+            _, page = GenericPage.create_browser_context(playwright)
 
             try:
                 for index, url in enumerate(urls, 1):
@@ -261,11 +258,7 @@ def main(file_path: str | None = None) -> None:
 
             finally:
                 # Close browser connection
-                if browser:
-                    try:
-                        browser.close()
-                    except Exception:
-                        pass
+                GenericPage.close_shared_browser()
 
     except KeyboardInterrupt:
         print("\n\nInterrupted by user. Cleaning up...")
@@ -273,7 +266,7 @@ def main(file_path: str | None = None) -> None:
     finally:
         # Always cleanup Chrome process
         ChromeManager.cleanup()
-        # Unregister atexit since we've already cleaned up
+        # Unregister the atexit hook set by ChromeManager.launch since we've already cleaned up
         try:
             atexit.unregister(ChromeManager.cleanup)
         except Exception:
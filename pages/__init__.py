@@ -1,6 +1,34 @@
-"""Page Object Model (POM) module."""
+"""Page Object Model (POM) module.
+
+AsyncGenericPage is imported lazily (PEP 562): it pulls in the Playwright
+async API, which the sync pages never need.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
 
 from .base_page import BasePage
 from .generic_page import GenericPage
 
-__all__ = ["BasePage", "GenericPage"]
+if TYPE_CHECKING:
+    from .async_generic_page import AsyncGenericPage
+
+_LAZY_IMPORTS = {
+    "AsyncGenericPage": ".async_generic_page",
+}
+
+__all__ = ["BasePage", "GenericPage", "AsyncGenericPage"]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining `name` on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List lazily importable names alongside the loaded ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,211 @@
+"""Async generic page class for capturing many URLs concurrently."""
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from playwright.async_api import Page, async_playwright
+
+from config import Settings
+from .base_page import AUTO_DISMISS_SCRIPT
+from utils.browser_fingerprint import get_browser_context_options_batch
+from utils.chrome_manager import ChromeManager
+
+if TYPE_CHECKING:
+    from utils.openai_extractor import OpenAIExtractor
+
+
+class AsyncGenericPage:
+    """Async counterpart of GenericPage used for concurrent screenshot capture."""
+
+    def __init__(self, page: Page, openai_extractor: "OpenAIExtractor | None" = None, output_dir: Path | None = None):
+        """
+        Initialize AsyncGenericPage.
+
+        Args:
+            page: Playwright async Page object
+            openai_extractor: Optional OpenAI extractor instance
+            output_dir: Optional output directory for screenshots
+        """
+        self.page = page
+        self.extractor = openai_extractor
+        self.output_dir = output_dir or Settings.OUTPUT_DIR
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    async def navigate(self, url: str) -> None:
+        """
+        Navigate to a URL and wait for the document to finish loading.
+
+        Args:
+            url: Target URL
+        """
+        try:
+            await self.page.goto(url, timeout=Settings.PAGE_LOAD_TIMEOUT, wait_until="domcontentloaded")
+        except Exception:
+            pass
+
+        try:
+            await self.page.wait_for_function(
+                "document.readyState === 'complete'",
+                timeout=Settings.PAGE_LOAD_TIMEOUT_READY,
+                polling=100
+            )
+        except Exception:
+            await asyncio.sleep(0.2)
+
+    async def take_screenshot(self, name: str = "screenshot") -> Path:
+        """
+        Take a screenshot of the current page.
+
+        Args:
+            name: Custom name for the screenshot
+
+        Returns:
+            Path to the saved screenshot
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        screenshot_path = self.output_dir / f"{name}_{timestamp}.{Settings.SCREENSHOT_FORMAT}"
+
+        await self.page.screenshot(
+            path=str(screenshot_path),
+            full_page=Settings.SCREENSHOT_FULL_PAGE,
+            type=Settings.SCREENSHOT_FORMAT
+        )
+
+        return screenshot_path
+
+    async def getResult(self, screenshot_path: Path, extraction_prompt: str | None = None) -> dict:
+        """
+        Create results from the screenshot extraction.
+
+        Extraction uses the extractor's async API, so other pages keep
+        progressing while a request is in flight.
+
+        Args:
+            screenshot_path: Path to the screenshot
+            extraction_prompt: Custom prompt for data extraction
+        """
+        try:
+            url, title = await self.page.evaluate("() => [location.href, document.title]")
+        except Exception:
+            url, title = self.page.url, ""
+
+        result = {
+            "url": url,
+            "title": title,
+            "screenshot_path": screenshot_path,
+            "extracted_data": None,
+            "product_info": None,
+            "final_price": None
+        }
+
+        if self.extractor:
+            if extraction_prompt:
+                result["extracted_data"] = await self.extractor.extract_data_async(
+                    screenshot_path,
+                    extraction_prompt
+                )
+            else:
+                product_info = await self.extractor.extract_product_info_async(screenshot_path)
+                result["product_info"] = product_info
+                result["final_price"] = self.extractor.calculate_final_price(product_info)
+
+        return result
+
+    async def capture_and_extract(
+        self,
+        screenshot_name: str = "screenshot",
+        extraction_prompt: str | None = None
+    ) -> dict:
+        """
+        Capture screenshot and extract data using OpenAI.
+
+        Args:
+            screenshot_name: Custom name for screenshot
+            extraction_prompt: Custom prompt for data extraction
+
+        Returns:
+            Dictionary with screenshot path and extracted data
+        """
+        screenshot_path = await self.take_screenshot(name=screenshot_name)
+        return await self.getResult(screenshot_path, extraction_prompt)
+
+    @classmethod
+    async def capture_many(
+        cls,
+        urls: list[str],
+        openai_extractor: "OpenAIExtractor | None" = None,
+        output_dir: Path | None = None,
+        concurrency: int = 8
+    ) -> list[dict]:
+        """
+        Navigate, capture and extract a list of URLs concurrently.
+
+        A pool of `concurrency` browser contexts is created on the shared Chrome
+        instance; each URL borrows a context, opens its own page and returns the
+        context to the pool when done.
+
+        Args:
+            urls: URLs to process
+            openai_extractor: Optional OpenAI extractor instance
+            output_dir: Optional output directory for screenshots
+            concurrency: Maximum number of pages processed at the same time
+
+        Returns:
+            One result dictionary per URL, in input order
+        """
+        # Reuse a debug Chrome that is already listening instead of killing and relaunching it
+        ChromeManager.ensure_running(port=9222)
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.connect_over_cdp("http://127.0.0.1:9222")
+
+            try:
+                # The Chrome profile's cookies (e.g. cf_clearance) seed every pooled context
+                profile_cookies = await browser.contexts[0].cookies() if browser.contexts else []
+
+                pool: asyncio.Queue = asyncio.Queue()
+                for options in get_browser_context_options_batch(max(1, min(concurrency, len(urls)))):
+                    context = await browser.new_context(**options)
+                    if profile_cookies:
+                        await context.add_cookies(profile_cookies)
+                    await context.add_init_script(path=AUTO_DISMISS_SCRIPT)
+                    pool.put_nowait(context)
+
+                async def process(index: int, url: str) -> dict:
+                    context = await pool.get()
+                    page = None
+                    try:
+                        page = await context.new_page()
+                        generic_page = cls(page, openai_extractor=openai_extractor, output_dir=output_dir)
+                        await generic_page.navigate(url)
+                        result = await generic_page.capture_and_extract(screenshot_name=f"url_{index}")
+                        return {
+                            "success": result.get("final_price") is not None,
+                            "url": url,
+                            "index": index,
+                            **result
+                        }
+                    except Exception as e:
+                        return {
+                            "success": False,
+                            "url": url,
+                            "index": index,
+                            "error": str(e)
+                        }
+                    finally:
+                        # The context always goes back to the pool, even if the page failed to open or close
+                        if page is not None:
+                            try:
+                                await page.close()
+                            except Exception:
+                                pass
+                        pool.put_nowait(context)
+
+                return list(await asyncio.gather(*(process(i, url) for i, url in enumerate(urls, 1))))
+
+            finally:
+                if openai_extractor:
+                    await openai_extractor.aclose()
+                await browser.close()
@@ -0,0 +1,72 @@
+// Auto-dismiss cookie banners and modal popups as soon as they appear.
+// Installed once per browser context as an init script, so the common
+// consent/close buttons are clicked in-page without Python round-trips.
+// The Python handlers still run afterwards as a fallback for text-based
+// selectors that plain CSS cannot express.
+(() => {
+    if (window.top !== window) return;
+
+    // CSS-only subset of CookieHandler / ModalHandler selectors
+    const SELECTORS = [
+        // Cookie consent
+        "#onetrust-accept-btn-handler",
+        "button[id*='onetrust-accept']",
+        "[data-testid='accept-cookies']",
+        "#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
+        "#CybotCookiebotDialogBodyButtonAccept",
+        ".trustarc-agree-btn",
+        "#truste-consent-button",
+        "[data-testid='uc-accept-all-button']",
+        ".qc-cmp2-summary-buttons button[mode='primary']",
+        "#didomi-notice-agree-button",
+        ".cookielaw-accept",
+        "#cookiescript_accept",
+        // Modal close buttons
+        "[aria-label='Close sign in nudge']",
+        ".sign-in-nudge__close",
+        ".sign-in-nudge__flyout-close",
+        ".zds-dialog-close-button",
+        "[role='dialog'] button[aria-label*='close' i]",
+    ];
+    const MAX_CLICKS = 10;
+    const OBSERVE_MS = 15000;
+
+    // Kept in the closure: a page-visible global could be fingerprinted or reset by the site
+    let clicks = 0;
+
+    const isVisible = (el) =>
+        !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length) &&
+        getComputedStyle(el).visibility !== "hidden";
+
+    const scan = () => {
+        for (const sel of SELECTORS) {
+            const el = document.querySelector(sel);
+            if (el && isVisible(el)) {
+                el.click();
+                clicks++;
+                return;
+            }
+        }
+    };
+
+    // Debounce mutation bursts into a single scan
+    let pending = false;
+    const schedule = () => {
+        if (pending || clicks >= MAX_CLICKS) return;
+        pending = true;
+        setTimeout(() => { pending = false; scan(); }, 100);
+    };
+
+    const start = () => {
+        const observer = new MutationObserver(schedule);
+        observer.observe(document.documentElement, { childList: true, subtree: true });
+        setTimeout(() => observer.disconnect(), OBSERVE_MS);
+        schedule();
+    };
+
+    if (document.documentElement) {
+        start();
+    } else {
+        document.addEventListener("DOMContentLoaded", start);
+    }
+})();
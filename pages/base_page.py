@@ -1,18 +1,54 @@
 """Base page class for Page Object Model implementation."""
 
 import time
+from functools import cached_property
 from pathlib import Path
-from playwright.sync_api import Page, Browser, Playwright
+from urllib.parse import urlparse
+from playwright.sync_api import Page, Browser, BrowserContext, Playwright, Route
 
 from config import Settings
 from utils.human_behavior import HumanBehavior
 from handlers import AntibotHandler, CloudflareHandler, CookieHandler, ModalHandler, ScreenshotHandler
+from utils.asset_cache import AssetCache
+from utils.browser_fingerprint import get_browser_context_options
 from utils.chrome_manager import ChromeManager
 
+# Init script that clicks common consent/close buttons in-page (see auto_dismiss.js)
+AUTO_DISMISS_SCRIPT = Path(__file__).with_name("auto_dismiss.js")
+
+# Batched DOM reads: one evaluate round-trip for any number of CSS selectors
+_GET_TEXTS_JS = "sels => sels.map(s => (document.querySelector(s) || {}).textContent || '')"
+_GET_VISIBILITIES_JS = """
+    sels => sels.map(s => {
+        const el = document.querySelector(s);
+        return !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+            && getComputedStyle(el).visibility !== 'hidden';
+    })
+"""
+
 
 class BasePage:
     """Base class for all page objects in the POM structure."""
 
+    # Presence check for every challenge handled on navigation, in one round-trip
+    _DETECT_CHALLENGES_JS = f"""
+        (args) => {{
+            const text = document.body ? document.body.innerText : '';
+            return {{
+                cf: ({CloudflareHandler.IS_CHALLENGE_JS})(args.cf),
+                slide: text.includes('Slide to complete'),
+                checkbox: !!document.querySelector(args.checkboxSelector),
+            }};
+        }}
+    """
+    # Every cookie/modal container as one selector group: a single DOM walk per navigation
+    _OVERLAY_SELECTOR = ", ".join(CookieHandler.COOKIE_MODAL_SELECTORS + ModalHandler.MODAL_CONTAINER_SELECTORS)
+
+    _DETECT_CHALLENGES_ARGS = {
+        "cf": CloudflareHandler.IS_CHALLENGE_ARGS,
+        "checkboxSelector": ", ".join(AntibotHandler.ROBOT_CHECKBOX_SELECTORS),
+    }
+
     def __init__(self, page: Page, output_dir: Path | None = None):
         """
         Initialize BasePage with a Playwright page.
@@ -22,37 +58,126 @@ class BasePage:
             output_dir: Optional output directory for screenshots
         """
         self.page = page
-        self.human = HumanBehavior(page)
-        self.screenshot = ScreenshotHandler(output_dir=output_dir)
-        self.antibot = AntibotHandler(page)
-        self.cloudflare = CloudflareHandler(page)
-        self.cookie_handler = CookieHandler(page)
-        self.modal_handler = ModalHandler(page)
+        self.human = HumanBehavior(page, simulate=Settings.HUMAN_SIMULATION_MODE == "always")
+        self.screenshot = ScreenshotHandler.for_output_dir(output_dir)
+
+    # Challenge/overlay handlers are only built when a page actually needs them
+
+    @cached_property
+    def antibot(self) -> AntibotHandler:
+        """Antibot handler for this page."""
+        return AntibotHandler(self.page)
+
+    @cached_property
+    def cloudflare(self) -> CloudflareHandler:
+        """Cloudflare handler for this page."""
+        return CloudflareHandler(self.page)
+
+    @cached_property
+    def cookie_handler(self) -> CookieHandler:
+        """Cookie consent handler for this page."""
+        return CookieHandler(self.page)
+
+    @cached_property
+    def modal_handler(self) -> ModalHandler:
+        """Modal popup handler for this page."""
+        return ModalHandler(self.page)
+
+    # Domains that showed a challenge during this run (drives HUMAN_SIMULATION_MODE=auto)
+    _challenge_domains: set[str] = set()
+
+    # Browser shared by every page object (one CDP connection per run)
+    _browser: Browser | None = None
+    _cdp_endpoint: str | None = None
+    _asset_cache: AssetCache | None = None
 
     @classmethod
-    def create_browser_context(cls, playwright: Playwright) -> tuple[Browser, Page]:
+    def create_browser_context(
+        cls,
+        playwright: Playwright,
+        block_resources: bool = Settings.BLOCK_RESOURCES,
+        cache_assets: bool = Settings.ASSET_CACHE
+    ) -> tuple[Browser, Page]:
         """
-        Create a browser context by connecting to a real Chrome instance via CDP.
+        Create an isolated browser context on a real Chrome instance via CDP.
         This bypasses bot detection by using an authentic Chrome browser.
 
+        Chrome is launched and connected on the first call only; later calls
+        reuse the shared connection and just open a new context and page.
+
         Args:
             playwright: Playwright instance
+            block_resources: Abort Settings.BLOCKED_RESOURCE_TYPES requests in this context
+            cache_assets: Serve static assets from the on-disk AssetCache
 
         Returns:
             Tuple of (Browser, Page)
         """
-        # Launch Chrome with remote debugging
-        ChromeManager.launch(port=9222)
+        browser = BasePage._browser
+        if browser is None or not browser.is_connected():
+            # Launch Chrome with remote debugging unless the previous instance is still up
+            if BasePage._cdp_endpoint is None or not ChromeManager.is_running():
+                ChromeManager.launch(port=9222)
+                BasePage._cdp_endpoint = "http://127.0.0.1:9222"
+
+            # Connect to Chrome via CDP
+            browser = BasePage._browser = playwright.chromium.connect_over_cdp(BasePage._cdp_endpoint)
+            print("    Connected to Chrome via CDP (stealth mode)")
+
+        # One context per page object: isolated cookies/storage per workload
+        context = browser.new_context(**get_browser_context_options())
+        # Seeded with the Chrome profile's cookies (e.g. cf_clearance) so earned clearances carry over
+        if browser.contexts and browser.contexts[0] is not context:
+            try:
+                context.add_cookies(browser.contexts[0].cookies())
+            except Exception:
+                pass
+        context.add_init_script(path=AUTO_DISMISS_SCRIPT)
+        # Later routes run first: blocking is checked before the cache is consulted
+        if cache_assets:
+            if BasePage._asset_cache is None:
+                BasePage._asset_cache = AssetCache()
+            context.route("**/*", BasePage._asset_cache.handle_route)
+        if block_resources:
+            cls.install_resource_blocker(context)
+        page = context.new_page()
+
+        return browser, page
+
+    @staticmethod
+    def install_resource_blocker(
+        context: BrowserContext,
+        resource_types: frozenset[str] = Settings.BLOCKED_RESOURCE_TYPES
+    ) -> None:
+        """
+        Abort requests that add loading time but nothing to detection or extraction.
 
-        # Connect to Chrome via CDP
-        browser = playwright.chromium.connect_over_cdp("http://127.0.0.1:9222")
+        Args:
+            context: Browser context to install the route on
+            resource_types: Playwright resource types to abort (e.g. "media", "font", "image")
+        """
+        def block(route: Route) -> None:
+            if route.request.resource_type in resource_types:
+                route.abort()
+            else:
+                route.fallback()
 
-        # Get or create a page
-        context = browser.contexts[0]
-        page = context.pages[0] if context.pages else context.new_page()
+        context.route("**/*", block)
 
-        print("    Connected to Chrome via CDP (stealth mode)")
-        return browser, page
+    @classmethod
+    def close_shared_browser(cls) -> None:
+        """Close the shared CDP connection, every context created on it and the asset cache."""
+        if BasePage._browser is not None:
+            try:
+                BasePage._browser.close()
+            except Exception:
+                pass
+            BasePage._browser = None
+            BasePage._cdp_endpoint = None
+
+        if BasePage._asset_cache is not None:
+            BasePage._asset_cache.close()
+            BasePage._asset_cache = None
 
     def navigate(self, url: str) -> None:
         """
@@ -66,58 +191,77 @@ class BasePage:
         except Exception:
             pass
 
-        # Wait for page to be fully loaded
+        # Wait for page to be fully loaded (networkidle rarely fires on tracker-heavy sites)
         try:
-            self.page.wait_for_load_state("networkidle", timeout=5000)
+            self.page.wait_for_function(
+                "document.readyState === 'complete' && !document.documentElement.hasAttribute('aria-busy')",
+                timeout=Settings.PAGE_LOAD_TIMEOUT_READY,
+                polling=100
+            )
         except Exception:
-            pass
-
-        # Brief wait for JavaScript rendering
-        time.sleep(0.5)
+            # Brief wait for JavaScript rendering
+            time.sleep(0.2)
 
         # Check for human verification during/after navigation
         self._handle_verification_popup()
 
-        # Handle cookie consent modals
-        self._handle_cookie_consent()
+        # Skip the cookie/modal handlers entirely when no container is in the DOM
+        if self._has_overlay():
+            # Handle cookie consent modals (fallback for banners the init script missed)
+            self._handle_cookie_consent()
 
-        # Handle other modals (sign-in, country selection, newsletters, etc.)
-        self._handle_modals()
+            # Handle other modals (sign-in, country selection, newsletters, etc.)
+            self._handle_modals()
 
-    def _handle_verification_popup(self, timeout: int = 10000) -> None:
+    def _handle_verification_popup(self) -> None:
         """Handle any verification popups that appear during navigation."""
+        # No load-state waits after solving: subsequent locator actions auto-wait
         try:
+            flags = self.page.evaluate(self._DETECT_CHALLENGES_JS, self._DETECT_CHALLENGES_ARGS)
+            self._update_simulation(any(flags.values()))
+
             # Check if this is a Cloudflare challenge page first (most common case)
-            if self.cloudflare.is_challenge_page():
+            if flags["cf"]:
                 print("    Cloudflare challenge detected during navigation...")
-                if self.cloudflare.solve_challenge():
+                if self.cloudflare.solve_challenge(detected=True):
                     print("    Cloudflare challenge solved")
-                    try:
-                        self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
-                    except Exception:
-                        pass
                     return
 
             # Check for puzzle captcha (Shein uses this)
-            if self.page.locator("text='Slide to complete'").count() > 0:
+            if flags["slide"]:
                 print("    Puzzle captcha detected - attempting to solve...")
                 if self.antibot.solve_puzzle_slider():
-                    try:
-                        self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
-                    except Exception:
-                        pass
                     return
 
             # Check for other human verification challenges
-            if self.antibot.solve_checkbox():
+            if flags["checkbox"] and self.antibot.solve_checkbox():
                 print("    Verification checkbox clicked")
-                try:
-                    self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
-                except Exception:
-                    pass
         except Exception:
             pass
 
+    def _update_simulation(self, challenge_detected: bool) -> None:
+        """
+        In auto mode, enable camouflage pauses only for sites that showed a challenge.
+
+        Challenge handlers always keep their own human-like timing.
+
+        Args:
+            challenge_detected: Whether the current page shows a challenge
+        """
+        if Settings.HUMAN_SIMULATION_MODE != "auto":
+            return
+        domain = urlparse(self.page.url).netloc
+        if challenge_detected:
+            BasePage._challenge_domains.add(domain)
+        self.human.simulate = domain in BasePage._challenge_domains
+
+    def _has_overlay(self) -> bool:
+        """Check whether any cookie banner or modal container exists on the page."""
+        try:
+            return self.page.locator(self._OVERLAY_SELECTOR).count() > 0
+        except Exception:
+            return True
+
     def _handle_cookie_consent(self) -> None:
         """Handle cookie consent modals that appear after page load."""
         try:
@@ -137,21 +281,18 @@ class BasePage:
             pass
 
     def get_title(self) -> str:
-        """Get the page title with retry on context destruction."""
-        for _ in range(3):
+        """Get the page title (read live: a reload or SPA update can change it on the same URL)."""
+        try:
+            return self.page.title()
+        except Exception as e:
+            if "context was destroyed" not in str(e).lower() and "navigation" not in str(e).lower():
+                return ""
+            # Page is navigating: resume as soon as the new document is ready, then retry once
             try:
+                self.page.wait_for_load_state("domcontentloaded", timeout=2000)
                 return self.page.title()
-            except Exception as e:
-                if "context was destroyed" in str(e).lower() or "navigation" in str(e).lower():
-                    # Page might have navigated, wait and retry
-                    time.sleep(1.0)
-                    try:
-                        self.page.wait_for_load_state("domcontentloaded", timeout=5000)
-                    except Exception:
-                        pass
-                else:
-                    return ""
-        return ""
+            except Exception:
+                return ""
 
     def get_url(self) -> str:
         """Get the current page URL."""
@@ -254,7 +395,35 @@ class BasePage:
         Returns:
             Text content of the element
         """
-        return self.page.locator(selector).text_content() or ""
+        return self.get_texts([selector])[0]
+
+    def get_texts(self, selectors: list[str]) -> list[str]:
+        """
+        Get text content of several elements in a single round-trip.
+
+        Args:
+            selectors: CSS selectors for the elements
+
+        Returns:
+            Text content for each selector (empty string if not found)
+        """
+        if not selectors:
+            return []
+        return self.page.evaluate(_GET_TEXTS_JS, selectors)
+
+    def get_visibilities(self, selectors: list[str]) -> list[bool]:
+        """
+        Check visibility of several elements in a single round-trip.
+
+        Args:
+            selectors: CSS selectors for the elements
+
+        Returns:
+            Visibility flag for each selector
+        """
+        if not selectors:
+            return []
+        return self.page.evaluate(_GET_VISIBILITIES_JS, selectors)
 
     def is_visible(self, selector: str) -> bool:
         """
@@ -266,8 +435,18 @@ class BasePage:
         Returns:
             True if element is visible
         """
-        return self.page.locator(selector).is_visible()
+        return self.get_visibilities([selector])[0]
+
+    def reset(self) -> None:
+        """
+        Return the page to a clean state so it can be reused for the next URL.
+
+        Navigating to about:blank keeps the renderer process alive, which is
+        much cheaper than closing the page and creating a new one.
+        """
+        self.page.goto("about:blank")
+        self.page.context.clear_cookies()
 
     def close(self) -> None:
-        """Close the page."""
+        """Close the page (final teardown only, prefer reset() between URLs)."""
         self.page.close()
@@ -1,14 +1,32 @@
 """Generic page class for handling any URL."""
 
+import asyncio
+from typing import TYPE_CHECKING
+
 from .base_page import BasePage
-from utils.openai_extractor import OpenAIExtractor
+from config import Settings
+from utils.structured_data import extract_product_from_json_ld
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from utils.openai_extractor import OpenAIExtractor
+
 
 class GenericPage(BasePage):
     """Generic page handler for any website URL."""
 
-    def __init__(self, page, openai_extractor: OpenAIExtractor | None = None, output_dir: Path | None = None):
+    _HARVEST_JS = """
+        () => ({
+            url: location.href,
+            title: document.title,
+            canonical: document.querySelector('link[rel="canonical"]')?.href || null,
+            ogImage: document.querySelector('meta[property="og:image"]')?.content || null,
+            h1: document.querySelector('h1')?.textContent.trim() || null,
+            jsonLd: [...document.querySelectorAll('script[type="application/ld+json"]')].map(s => s.textContent),
+        })
+    """
+
+    def __init__(self, page, openai_extractor: "OpenAIExtractor | None" = None, output_dir: Path | None = None):
         """
         Initialize GenericPage.
 
@@ -20,32 +38,63 @@ class GenericPage(BasePage):
         super().__init__(page, output_dir=output_dir)
         self.extractor = openai_extractor
     
-    def getResult(self, screenshot_path: Path, extraction_prompt: str | None = None) -> dict:
+    def getResult(
+        self,
+        screenshot_path: Path | None,
+        extraction_prompt: str | None = None,
+        image: Path | bytes | None = None,
+        extract: bool = True
+    ) -> dict:
         """
         Create results from the screenshot extraction.
 
         Args:
-            path: Path to the screenshot
+            screenshot_path: Path to the saved screenshot (None if not saved)
+            extraction_prompt: Custom prompt for data extraction
+            image: Image sent to the extractor (defaults to screenshot_path)
+            extract: If False, skip extraction (see getResults_batch)
         """
+        # Harvest every page field we need in one round-trip
+        try:
+            page_data = self.page.evaluate(self._HARVEST_JS)
+        except Exception:
+            page_data = {"url": self.get_url(), "title": "", "jsonLd": []}
+
         result = {
-            "url": self.get_url(),
-            "title": self.get_title(),
+            "url": page_data["url"],
+            "title": page_data["title"],
+            "canonical_url": page_data.get("canonical"),
+            "og_image": page_data.get("ogImage"),
+            "heading": page_data.get("h1"),
             "screenshot_path": screenshot_path,
             "extracted_data": None,
             "product_info": None,
             "final_price": None
         }
 
+        # Product schema on the page already identifies the offer: no vision call needed
+        if self.extractor and not extraction_prompt and Settings.USE_STRUCTURED_DATA:
+            product_info = extract_product_from_json_ld(
+                page_data.get("jsonLd") or [],
+                page_urls=[page_data["url"], page_data.get("canonical")]
+            )
+            if product_info:
+                result["product_info"] = product_info
+                result["final_price"] = self.extractor.calculate_final_price(product_info)
+                return result
+
+        image = image if image is not None else screenshot_path
+
         # Extract data if extractor is available
-        if self.extractor:
+        if extract and self.extractor and image is not None:
             if extraction_prompt:
                 result["extracted_data"] = self.extractor.extract_data(
-                    screenshot_path,
+                    image,
                     extraction_prompt
                 )
             else:
                 # Default to product info extraction
-                product_info = self.extractor.extract_product_info(screenshot_path)
+                product_info = self.extractor.extract_product_info(image)
                 result["product_info"] = product_info
                 result["final_price"] = self.extractor.calculate_final_price(product_info)
 
@@ -56,16 +105,23 @@ class GenericPage(BasePage):
         screenshot_name: str | None = None,
         extraction_prompt: str | None = None,
         selector: str | None = None,
-        padding: int = 10
+        padding: int = 10,
+        save_screenshot: bool = True,
+        extract: bool = True
     ) -> dict:
         """
         Capture screenshot and extract data using OpenAI.
 
+        Page screenshots are kept in memory and handed to the extractor
+        directly; the file is only written when save_screenshot is True.
+
         Args:
             screenshot_name: Optional custom name for screenshot
             extraction_prompt: Custom prompt for data extraction
             selector: Optional CSS selector for element capture (full page if None)
             padding: Extra padding around element (only used with selector)
+            save_screenshot: Whether to write the page screenshot to disk
+            extract: If False, only capture; extract later with getResults_batch
 
         Returns:
             Dictionary with screenshot path and extracted data
@@ -74,6 +130,65 @@ class GenericPage(BasePage):
             screenshot_path = self.take_element_screenshot(
                 selector, name=screenshot_name, padding=padding
             )
-        else:
-            screenshot_path = self.take_screenshot(name=screenshot_name)
-        return self.getResult(screenshot_path, extraction_prompt)
+            return self.getResult(screenshot_path, extraction_prompt, extract=extract)
+
+        image = self.screenshot.capture_bytes(self.page)
+        screenshot_path = None
+        if save_screenshot or not extract:
+            screenshot_path = self.screenshot.save_bytes(image, name=screenshot_name or "screenshot")
+        return self.getResult(screenshot_path, extraction_prompt, image=image, extract=extract)
+
+    def getResults_batch(self, results: list[dict]) -> list[dict]:
+        """
+        Run product extraction for results captured with extract=False.
+
+        All screenshots are sent concurrently instead of one request per page.
+
+        Args:
+            results: Result dictionaries returned by capture_and_extract(extract=False)
+
+        Returns:
+            The same dictionaries, filled with product_info and final_price
+        """
+        if not self.extractor:
+            return results
+
+        pending = [r for r in results if r.get("screenshot_path") and r.get("product_info") is None]
+        product_infos = self.extractor.extract_product_info_batch([r["screenshot_path"] for r in pending])
+        for result, product_info in zip(pending, product_infos):
+            result["product_info"] = product_info
+            result["final_price"] = self.extractor.calculate_final_price(product_info)
+
+        return results
+
+    @staticmethod
+    def capture_many(
+        urls: list[str],
+        openai_extractor: "OpenAIExtractor | None" = None,
+        output_dir: Path | None = None,
+        concurrency: int = 8
+    ) -> list[dict]:
+        """
+        Capture and extract several URLs concurrently with a pool of browser contexts.
+
+        Runs on the async Playwright API, so it must be called outside of a
+        sync_playwright() block. Challenge/cookie/modal handlers are not run.
+
+        Args:
+            urls: URLs to process
+            openai_extractor: Optional OpenAI extractor instance
+            output_dir: Optional output directory for screenshots
+            concurrency: Maximum number of pages processed at the same time
+
+        Returns:
+            One result dictionary per URL, in input order
+        """
+        # Imported here: the async Playwright API is only needed by this entry point
+        from .async_generic_page import AsyncGenericPage
+
+        return asyncio.run(AsyncGenericPage.capture_many(
+            urls,
+            openai_extractor=openai_extractor,
+            output_dir=output_dir,
+            concurrency=concurrency
+        ))
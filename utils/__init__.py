@@ -1,12 +1,40 @@
-"""Utility modules for the screenshot saver project."""
+"""Utility modules for the screenshot saver project.
 
-from .types import BoundingBox
-from .word_reader import WordReader
-from .text_reader import TextReader
-from .openai_extractor import OpenAIExtractor
-from .human_behavior import HumanBehavior
-from .browser_fingerprint import get_browser_context_options, get_random_user_agent
-from .chrome_manager import ChromeManager
+Submodules are imported lazily (PEP 562) so that importing a light helper does
+not pull in heavy dependencies such as the OpenAI SDK or python-docx.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .types import BoundingBox
+    from .word_reader import WordReader
+    from .text_reader import TextReader
+    from .openai_extractor import OpenAIExtractor
+    from .human_behavior import HumanBehavior
+    from .human_behavior_async import AsyncHumanBehavior
+    from .browser_fingerprint import (
+        get_browser_context_options,
+        get_browser_context_options_batch,
+        get_random_user_agent,
+    )
+    from .chrome_manager import ChromeManager
+    from .structured_data import extract_product_from_json_ld
+
+_LAZY_IMPORTS = {
+    "BoundingBox": ".types",
+    "WordReader": ".word_reader",
+    "TextReader": ".text_reader",
+    "OpenAIExtractor": ".openai_extractor",
+    "HumanBehavior": ".human_behavior",
+    "AsyncHumanBehavior": ".human_behavior_async",
+    "get_browser_context_options": ".browser_fingerprint",
+    "get_browser_context_options_batch": ".browser_fingerprint",
+    "get_random_user_agent": ".browser_fingerprint",
+    "ChromeManager": ".chrome_manager",
+    "extract_product_from_json_ld": ".structured_data",
+}
 
 __all__ = [
     "BoundingBox",
@@ -14,7 +42,24 @@ __all__ = [
     "TextReader",
     "OpenAIExtractor",
     "HumanBehavior",
+    "AsyncHumanBehavior",
     "get_browser_context_options",
+    "get_browser_context_options_batch",
     "get_random_user_agent",
     "ChromeManager",
+    "extract_product_from_json_ld",
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining `name` on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List lazily importable names alongside the loaded ones."""
+    return sorted(set(globals()) | set(__all__))
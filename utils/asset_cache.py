@@ -0,0 +1,231 @@
+"""On-disk cache for static assets, served to the browser through Playwright routing."""
+
+import json
+import re
+import sqlite3
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from config import Settings
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Route
+
+# Cache-Control max-age directive (the value is in seconds)
+_MAX_AGE_RE = re.compile(r"(?:^|[,\s])max-age\s*=\s*\"?(\d+)")
+
+# Upper bound in seconds on the freshness guessed from Last-Modified alone
+_MAX_HEURISTIC_FRESHNESS = 24 * 3600
+
+
+def _http_date(value: str | None) -> float | None:
+    """Parse an HTTP date header into a POSIX timestamp."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _expiry(headers: dict, now: float) -> float | None:
+    """
+    Compute when a response stops being fresh, following its caching headers.
+
+    Freshness comes from Cache-Control max-age (minus Age), then Expires, then
+    the usual heuristic of 10% of the time since Last-Modified (at most a day).
+
+    Args:
+        headers: Response headers with lower-case names
+        now: Current POSIX time
+
+    Returns:
+        POSIX time the response expires at (now when it must always be revalidated),
+        or None if the response must not be stored (no-store, private, per-user Vary)
+    """
+    cache_control = headers.get("cache-control", "").lower()
+    if "no-store" in cache_control or "private" in cache_control:
+        return None
+    vary = headers.get("vary", "").lower()
+    if "*" in vary or "cookie" in vary:
+        return None
+    if "no-cache" in cache_control:
+        return now
+
+    max_age = _MAX_AGE_RE.search(cache_control)
+    if max_age:
+        age = headers.get("age", "0")
+        return now + int(max_age.group(1)) - (int(age) if age.isdigit() else 0)
+
+    if "expires" in headers:
+        # An invalid Expires value (e.g. "0") means already expired
+        expires = _http_date(headers["expires"])
+        return expires if expires is not None else now
+
+    last_modified = _http_date(headers.get("last-modified"))
+    if last_modified is not None:
+        return now + min(max(0.0, (now - last_modified) * 0.1), _MAX_HEURISTIC_FRESHNESS)
+    return now
+
+
+class AssetCache:
+    """
+    SQLite-backed LRU cache of static asset responses, shared across runs.
+
+    Entries keep the response validators (ETag, Last-Modified) and an expiry
+    derived from the caching headers: fresh entries are served from disk, stale
+    ones are revalidated with a conditional request and reused on a 304.
+    """
+
+    # Request types worth caching (static, reused across pages of the same sites)
+    CACHED_RESOURCE_TYPES = frozenset({"stylesheet", "script", "font", "image"})
+
+    # Headers describing the wire encoding, invalid once the body is stored decoded
+    _SKIPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+    def __init__(self, path: Path = Settings.ASSET_CACHE_PATH, max_entries: int = 5000):
+        """
+        Initialize AssetCache.
+
+        Args:
+            path: SQLite database file (created if missing)
+            max_entries: Number of assets kept before the least recently used are evicted
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path)
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(assets)")}
+        if columns and "expires" not in columns:
+            # Table from a version without validators: its entries cannot be revalidated
+            self.connection.execute("DROP TABLE assets")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS assets ("
+            "url TEXT PRIMARY KEY, headers TEXT NOT NULL, body BLOB NOT NULL, "
+            "etag TEXT, last_modified TEXT, expires REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self.connection.commit()
+
+    def get(self, url: str) -> tuple[dict, bytes, str | None, str | None, float] | None:
+        """
+        Look up a cached asset.
+
+        Args:
+            url: Asset URL
+
+        Returns:
+            Tuple of (headers, body, ETag, Last-Modified, expiry time), or None on a miss
+        """
+        row = self.connection.execute(
+            "SELECT headers, body, etag, last_modified, expires FROM assets WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        self.connection.execute("UPDATE assets SET last_access = ? WHERE url = ?", (time.time(), url))
+        self.connection.commit()
+        return json.loads(row[0]), row[1], row[2], row[3], row[4]
+
+    def set(self, url: str, headers: dict, body: bytes, expires: float) -> None:
+        """
+        Store an asset, evicting the least recently used entries beyond max_entries.
+
+        Args:
+            url: Asset URL
+            headers: Response headers with lower-case names
+            body: Decoded response body
+            expires: POSIX time the response stops being fresh
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO assets (url, headers, body, etag, last_modified, expires, last_access) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                url, json.dumps(headers), body, headers.get("etag"), headers.get("last-modified"),
+                expires, time.time()
+            )
+        )
+        self.connection.execute(
+            "DELETE FROM assets WHERE url NOT IN (SELECT url FROM assets ORDER BY last_access DESC LIMIT ?)",
+            (self.max_entries,)
+        )
+        self.connection.commit()
+
+    def refresh(self, url: str, expires: float) -> None:
+        """
+        Extend a cached asset's freshness after a successful revalidation.
+
+        Args:
+            url: Asset URL
+            expires: New POSIX time the response stops being fresh
+        """
+        self.connection.execute("UPDATE assets SET expires = ? WHERE url = ?", (expires, url))
+        self.connection.commit()
+
+    def delete(self, url: str) -> None:
+        """
+        Drop a cached asset.
+
+        Args:
+            url: Asset URL
+        """
+        self.connection.execute("DELETE FROM assets WHERE url = ?", (url,))
+        self.connection.commit()
+
+    def handle_route(self, route: "Route") -> None:
+        """Serve fresh assets from disk, revalidating stale ones and storing cacheable responses."""
+        request = route.request
+        if request.method != "GET" or request.resource_type not in self.CACHED_RESOURCE_TYPES:
+            route.fallback()
+            return
+
+        now = time.time()
+        hit = self.get(request.url)
+        conditional_headers = {}
+        if hit:
+            headers, body, etag, last_modified, expires = hit
+            if now < expires:
+                route.fulfill(status=200, headers=headers, body=body)
+                return
+            if etag:
+                conditional_headers["if-none-match"] = etag
+            if last_modified:
+                conditional_headers["if-modified-since"] = last_modified
+
+        try:
+            if conditional_headers:
+                response = route.fetch(headers={**request.headers, **conditional_headers})
+            else:
+                response = route.fetch()
+        except Exception:
+            route.fallback()
+            return
+
+        response_headers = {k.lower(): v for k, v in response.headers.items()}
+        if hit and response.status == 304:
+            # Still valid: serve the stored body with the freshness granted by the 304
+            headers, body = hit[0], hit[1]
+            expires = _expiry({**headers, **response_headers}, now)
+            if expires is None:
+                self.delete(request.url)
+            else:
+                self.refresh(request.url, expires)
+            route.fulfill(status=200, headers=headers, body=body)
+            return
+
+        if response.status == 200:
+            expires = _expiry(response_headers, now)
+            # Responses without freshness or validators would be refetched in full anyway
+            has_validator = "etag" in response_headers or "last-modified" in response_headers
+            if expires is not None and (expires > now or has_validator):
+                headers = {k: v for k, v in response_headers.items() if k not in self._SKIPPED_HEADERS}
+                self.set(request.url, headers, response.body(), expires)
+            elif hit:
+                self.delete(request.url)
+        elif hit:
+            self.delete(request.url)
+
+        route.fulfill(response=response)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
@@ -3,7 +3,7 @@
 import random
 
 # Modern user agents pool (Chrome, Firefox, Safari, Edge on Windows/Mac)
-USER_AGENTS = [
+USER_AGENTS = (
     # Chrome on Windows
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
@@ -22,17 +22,17 @@ USER_AGENTS = [
     # Edge on Windows
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 Edg/122.0.0.0",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36 Edg/121.0.0.0",
-]
+)
 
 # Common screen resolutions
-SCREEN_RESOLUTIONS = [
+SCREEN_RESOLUTIONS = (
     {"width": 1920, "height": 1080},
     {"width": 1366, "height": 768},
     {"width": 1536, "height": 864},
     {"width": 1440, "height": 900},
     {"width": 1280, "height": 720},
     {"width": 2560, "height": 1440},
-]
+)
 
 # Timezone to locale mapping
 TIMEZONE_LOCALE_MAP = {
@@ -53,36 +53,78 @@ TIMEZONE_LOCALE_MAP = {
     "Europe/Zurich": "fr-CH",
 }
 
+TIMEZONES = tuple(TIMEZONE_LOCALE_MAP)
+# Sampled as pairs so building options needs no locale lookup
+_TIMEZONE_LOCALE_PAIRS = tuple(TIMEZONE_LOCALE_MAP.items())
+COLOR_SCHEMES = ("light", "dark", "no-preference")
+
+# Dedicated generator, bound once
+_rng = random.Random()
+_choice = _rng.choice
+
 
 def get_random_user_agent() -> str:
     """Get a random user agent string."""
-    return random.choice(USER_AGENTS)
+    return _choice(USER_AGENTS)
 
 
 def get_random_viewport() -> dict:
     """Get a random viewport size."""
-    return random.choice(SCREEN_RESOLUTIONS)
+    return _choice(SCREEN_RESOLUTIONS)
 
 
 def get_random_timezone() -> str:
     """Get a random timezone."""
-    return random.choice(list(TIMEZONE_LOCALE_MAP.keys()))
+    return _choice(TIMEZONES)
 
 
-def get_browser_context_options() -> dict:
-    """Get randomized browser context options for better antibot evasion."""
-    user_agent = get_random_user_agent()
-    viewport = get_random_viewport()
-    timezone = get_random_timezone()
-    locale = TIMEZONE_LOCALE_MAP[timezone]
+def _build_context_options(
+    viewport: dict,
+    timezone_locale: tuple[str, str],
+    color_scheme: str
+) -> dict:
+    """
+    Assemble browser context options from the randomized values.
 
+    No user_agent is set: contexts live on a real Chrome, whose own UA matches
+    its engine and client hints, while an overridden one would contradict them.
+    """
+    timezone, locale = timezone_locale
     return {
-        "user_agent": user_agent,
         "viewport": viewport,
         "timezone_id": timezone,
         "locale": locale,
-        "color_scheme": random.choice(["light", "dark", "no-preference"]),
+        "color_scheme": color_scheme,
         "has_touch": False,
         "is_mobile": False,
         "java_script_enabled": True,
     }
+
+
+def get_browser_context_options() -> dict:
+    """Get randomized browser context options for better antibot evasion."""
+    return _build_context_options(
+        get_random_viewport(),
+        _choice(_TIMEZONE_LOCALE_PAIRS),
+        _choice(COLOR_SCHEMES)
+    )
+
+
+def get_browser_context_options_batch(n: int) -> list[dict]:
+    """
+    Get randomized browser context options for n contexts at once.
+
+    Args:
+        n: Number of option sets to generate
+
+    Returns:
+        List of n independent option dictionaries
+    """
+    return [
+        _build_context_options(*values)
+        for values in zip(
+            _rng.choices(SCREEN_RESOLUTIONS, k=n),
+            _rng.choices(_TIMEZONE_LOCALE_PAIRS, k=n),
+            _rng.choices(COLOR_SCHEMES, k=n)
+        )
+    ]
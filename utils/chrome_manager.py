@@ -1,10 +1,11 @@
 """Chrome browser process manager for CDP connection."""
 
+import atexit
 import os
 import signal
+import socket
 import subprocess
 import time
-import urllib.request
 
 from config import Settings
 
@@ -13,14 +14,18 @@ class ChromeManager:
     """Manages Chrome browser process for CDP connection."""
 
     process = None
+    port = 9222
 
     @classmethod
     def launch(cls, port: int = 9222) -> subprocess.Popen:
         """Launch Chrome with remote debugging enabled."""
-        # Kill any existing Chrome debug instances
-        subprocess.run(['pkill', '-f', 'Chrome.*remote-debugging'], capture_output=True)
-        time.sleep(1)
+        # Kill any leftover Chrome debug instance still holding the port
+        if cls._is_port_in_use(port):
+            subprocess.run(['pkill', '-f', 'Chrome.*remote-debugging'], capture_output=True)
+            # Resume as soon as the old instance has released the port
+            cls._poll(lambda: not cls._is_port_in_use(port))
 
+        cls.port = port
         chrome_path = Settings.CHROME_PATH
 
         # Create a temporary profile directory
@@ -50,19 +55,58 @@ class ChromeManager:
             preexec_fn=os.setpgrp
         )
 
-        # Wait for Chrome to be ready (check if debugging port is open)
-        for i in range(10):
-            time.sleep(1)
-            try:
-                urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=1)
-                print(f"    Chrome started on port {port}")
-                break
-            except Exception:
-                if i == 9:
-                    print("    Warning: Chrome may not have started properly")
+        # Make sure the process is cleaned up even if the caller crashes
+        atexit.unregister(cls.cleanup)
+        atexit.register(cls.cleanup)
+
+        # Wait for Chrome to be ready (DevTools only listens once it can serve requests)
+        if cls._poll(lambda: cls._is_port_in_use(port)):
+            print(f"    Chrome started on port {port}")
+        else:
+            print("    Warning: Chrome may not have started properly")
 
         return cls.process
 
+    @classmethod
+    def ensure_running(cls, port: int = 9222) -> None:
+        """Launch Chrome only if no debug instance is already listening on the port."""
+        if not cls._is_port_in_use(port):
+            cls.launch(port=port)
+
+    @staticmethod
+    def _poll(condition, attempts: int = 12, initial_delay: float = 0.05, max_delay: float = 1.0) -> bool:
+        """
+        Poll a condition with exponential backoff.
+
+        Args:
+            condition: Callable returning True once the awaited state is reached
+            attempts: Maximum number of checks
+            initial_delay: Seconds to wait after the first failed check
+            max_delay: Upper bound for the wait between checks
+
+        Returns:
+            True if the condition was met within the allowed attempts
+        """
+        delay = initial_delay
+        for _ in range(attempts):
+            if condition():
+                return True
+            time.sleep(delay)
+            delay = min(delay * 1.6, max_delay)
+        return False
+
+    @classmethod
+    def is_running(cls) -> bool:
+        """Check whether the Chrome process launched by this manager is still alive."""
+        return cls.process is not None and cls.process.poll() is None
+
+    @staticmethod
+    def _is_port_in_use(port: int) -> bool:
+        """Check whether something is already listening on the debugging port."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.2)
+            return sock.connect_ex(("127.0.0.1", port)) == 0
+
     @classmethod
     def cleanup(cls) -> None:
         """Clean up Chrome process on exit."""
@@ -71,7 +115,7 @@ class ChromeManager:
             try:
                 # Try SIGTERM first (graceful)
                 os.killpg(os.getpgid(cls.process.pid), signal.SIGTERM)
-                time.sleep(1)
+                cls.process.wait(timeout=1)
             except Exception:
                 pass
 
@@ -84,14 +128,15 @@ class ChromeManager:
 
             cls.process = None
 
-        # Also kill any remaining Chrome debug instances
-        try:
-            subprocess.run(
-                ['pkill', '-f', 'Chrome.*remote-debugging'],
-                capture_output=True,
-                timeout=5
-            )
-        except Exception:
-            pass
+        # Also kill any remaining Chrome debug instance (only if one still holds the port)
+        if cls._is_port_in_use(cls.port):
+            try:
+                subprocess.run(
+                    ['pkill', '-f', 'Chrome.*remote-debugging'],
+                    capture_output=True,
+                    timeout=5
+                )
+            except Exception:
+                pass
 
         print("    Chrome process cleaned up")
@@ -1,25 +1,42 @@
 """Human-like browser behavior simulation utilities."""
 
+import math
 import random
 import time
-
-from playwright.sync_api import Page
+from typing import TYPE_CHECKING
 
 from config import Settings
 from utils.types import BoundingBox
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
 
 class HumanBehavior:
     """Simulates human-like browser interactions."""
 
-    def __init__(self, page: Page):
+    def __init__(self, page: "Page", simulate: bool = Settings.HUMAN_SIMULATION_MODE != "never"):
         """
         Initialize HumanBehavior with a Playwright page.
 
         Args:
             page: Playwright Page object
+            simulate: If False, skip the camouflage pauses between actions
         """
         self.page = page
+        self.simulate = simulate
+        # Last known mouse position (None until the first move), so paths start where the cursor is
+        self._mouse: tuple[float, float] | None = None
+        self._viewport: dict | None = None
+        # Dedicated generator, so per-step draws avoid the shared module-level one
+        self._rng = random.Random()
+        # page.mouse.move bound once, for the per-step loops
+        self._move = page.mouse.move
+
+    def _pause(self, min_s: float, max_s: float) -> None:
+        """Sleep for a random camouflage pause, unless simulation is disabled."""
+        if self.simulate:
+            time.sleep(self._rng.uniform(min_s, max_s))
 
     def random_delay(
         self,
@@ -33,9 +50,11 @@ class HumanBehavior:
             min_ms: Minimum delay in milliseconds
             max_ms: Maximum delay in milliseconds
         """
+        if not self.simulate:
+            return
         min_delay = min_ms or Settings.MIN_ACTION_DELAY
         max_delay = max_ms or Settings.MAX_ACTION_DELAY
-        delay = random.randint(min_delay, max_delay) / 1000
+        delay = self._rng.randint(min_delay, max_delay) / 1000
         time.sleep(delay)
 
     def mouse_move(self, x: float, y: float) -> None:
@@ -46,27 +65,84 @@ class HumanBehavior:
             x: Target X coordinate
             y: Target Y coordinate
         """
-        # Get current position (approximate from viewport center)
-        viewport = self.page.viewport_size
-        if viewport:
-            current_x = viewport["width"] // 2
-            current_y = viewport["height"] // 2
+        points, delays = self._plan_move(x, y)
+
+        move = self._move
+        for (intermediate_x, intermediate_y), delay in zip(points, delays):
+            move(intermediate_x, intermediate_y)
+            if delay:
+                time.sleep(delay)
+        self._mouse = points[-1]
+
+    def _plan_move(self, x: float, y: float) -> tuple[list[tuple[int, int]], list[float]]:
+        """
+        Precompute the path and per-step pauses of a mouse movement (no browser I/O).
+
+        Shared with AsyncHumanBehavior, which only differs in how the steps are sent.
+
+        Args:
+            x: Target X coordinate
+            y: Target Y coordinate
+
+        Returns:
+            Tuple of (points along the path, pause in seconds after each point)
+        """
+        # Get current position (approximate from viewport center before the first move)
+        if self._mouse:
+            current_x, current_y = self._mouse
         else:
-            current_x, current_y = 0, 0
+            if self._viewport is None:
+                self._viewport = self.page.viewport_size or {"width": 0, "height": 0}
+            current_x = self._viewport["width"] // 2
+            current_y = self._viewport["height"] // 2
+
+        # Step count proportional to the distance (5-25 points, one per ~40px)
+        distance = math.hypot(x - current_x, y - current_y)
+        steps = min(25, max(5, int(distance / 40)))
+        points = self._trajectory(current_x, current_y, x, y, steps)
+
+        # Per-step pauses drawn up front, sine-eased (slower near both ends); short hops skip them
+        if self.simulate and distance >= 100:
+            uniform, sin = self._rng.uniform, math.sin
+            delays = [uniform(0.005, 0.02) * (1 - 0.5 * sin(math.pi * (i + 1) / steps)) for i in range(steps)]
+        else:
+            delays = [0.0] * steps
 
-        # Calculate steps for smooth movement
-        steps = random.randint(10, 25)
-        for i in range(steps):
-            progress = (i + 1) / steps
-            # Add slight randomness to path
-            jitter_x = random.randint(-2, 2)
-            jitter_y = random.randint(-2, 2)
+        return points, delays
 
-            intermediate_x = int(current_x + (x - current_x) * progress) + jitter_x
-            intermediate_y = int(current_y + (y - current_y) * progress) + jitter_y
+    def _trajectory(self, start_x: float, start_y: float, x: float, y: float, steps: int) -> list[tuple[int, int]]:
+        """
+        Precompute the intermediate points of a mouse movement along a cubic Bézier curve.
 
-            self.page.mouse.move(intermediate_x, intermediate_y)
-            time.sleep(random.uniform(0.005, 0.02))
+        The two control points sit at a third and two thirds of the straight line,
+        offset by Gaussian noise proportional to the distance, so each path bends slightly.
+
+        Args:
+            start_x: Starting X coordinate
+            start_y: Starting Y coordinate
+            x: Target X coordinate
+            y: Target Y coordinate
+            steps: Number of intermediate points
+
+        Returns:
+            List of (x, y) points along the path, ending exactly on the target
+        """
+        dx, dy = x - start_x, y - start_y
+        gauss = self._rng.gauss
+        spread = 0.1 * math.hypot(dx, dy)
+        c1x, c1y = start_x + dx / 3 + gauss(0, spread), start_y + dy / 3 + gauss(0, spread)
+        c2x, c2y = start_x + 2 * dx / 3 + gauss(0, spread), start_y + 2 * dy / 3 + gauss(0, spread)
+
+        points = []
+        for i in range(1, steps + 1):
+            t = i / steps
+            u = 1 - t
+            a, b, c, d = u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t
+            points.append((
+                int(a * start_x + b * c1x + c * c2x + d * x),
+                int(a * start_y + b * c1y + c * c2y + d * y)
+            ))
+        return points
 
     def click_at(self, x: float, y: float) -> None:
         """
@@ -77,8 +153,9 @@ class HumanBehavior:
             y: Y coordinate to click
         """
         self.mouse_move(x, y)
-        time.sleep(random.uniform(0.1, 0.3))
+        self._pause(0.1, 0.3)
         self.page.mouse.click(x, y)
+        self._mouse = (x, y)
 
     def hold_at(self, x: float, y: float, duration: float | None = None) -> None:
         """
@@ -90,8 +167,8 @@ class HumanBehavior:
             duration: Hold duration in seconds (randomized 2-4s if not specified)
         """
         self.mouse_move(x, y)
-        time.sleep(random.uniform(0.1, 0.3))
-        hold_time = duration or random.uniform(2.0, 4.0)
+        self._pause(0.1, 0.3)
+        hold_time = duration or self._rng.uniform(2.0, 4.0)
         self.page.mouse.down()
         time.sleep(hold_time)
         self.page.mouse.up()
@@ -110,8 +187,9 @@ class HumanBehavior:
             hold: If True, press and hold instead of click
             hold_duration: Hold duration in seconds (used only if hold=True)
         """
-        x = box["x"] + box["width"] / 2 + random.randint(-3, 3)
-        y = box["y"] + box["height"] / 2 + random.randint(-3, 3)
+        randint = self._rng.randint
+        x = box["x"] + box["width"] / 2 + randint(-3, 3)
+        y = box["y"] + box["height"] / 2 + randint(-3, 3)
 
         if hold:
             self.hold_at(x, y, hold_duration)
@@ -152,14 +230,26 @@ class HumanBehavior:
 
         # Move to start position
         self.mouse_move(start_x, start_y)
-        time.sleep(random.uniform(0.1, 0.3))
+        self._pause(0.1, 0.3)
 
         # Press mouse button
         self.page.mouse.down()
-        time.sleep(random.uniform(0.05, 0.15))
-
-        # Drag with human-like motion
-        self.mouse_move(end_x, end_y)
+        self._pause(0.05, 0.15)
+
+        # Drag with human-like motion: a few slightly wobbling segments, each interpolated
+        # by Playwright in a single call (steps=) instead of one round-trip per point
+        rng = self._rng
+        segments = rng.randint(3, 4)
+        for i in range(1, segments + 1):
+            progress = i / segments
+            wobble = rng.uniform(-3, 3) if i < segments else 0
+            self._move(
+                start_x + (end_x - start_x) * progress,
+                start_y + (end_y - start_y) * progress + wobble,
+                steps=rng.randint(5, 8)
+            )
+        self._mouse = (end_x, end_y)
+        self._pause(0.05, 0.15)
 
         # Release mouse button
         self.page.mouse.up()
@@ -176,8 +266,35 @@ class HumanBehavior:
         element.click()
         self.random_delay(200, 500)
 
-        for char in text:
-            element.press_sequentially(char, delay=random.randint(50, 150))
+        # One call per run of characters; only the thinking pauses between runs cost extra calls
+        for index, run in enumerate(self._typing_runs(text)):
+            if index:
+                self.random_delay(200, 600)
+            element.press_sequentially(run, delay=self._rng.randint(80, 120))
+
+    def _typing_runs(self, text: str) -> list[str]:
+        """
+        Split text into runs typed in a single call each.
+
+        A run ends after a space or punctuation mark with 10% probability,
+        where a person would briefly pause to think.
+
+        Args:
+            text: Text to type
+
+        Returns:
+            Consecutive runs that concatenate back to text
+        """
+        runs = []
+        start = 0
+        chance = self._rng.random
+        for end, char in enumerate(text, 1):
+            if (char.isspace() or char in ",.;:!?") and chance() < 0.1:
+                runs.append(text[start:end])
+                start = end
+        if start < len(text):
+            runs.append(text[start:])
+        return runs
 
     def wait_for_ready(self, timeout: int = 5000) -> None:
         """
@@ -0,0 +1,223 @@
+"""Human-like browser behavior simulation for the Playwright async API."""
+
+import asyncio
+import random
+from typing import TYPE_CHECKING
+
+from config import Settings
+from utils.human_behavior import HumanBehavior
+from utils.types import BoundingBox
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+
+class AsyncHumanBehavior:
+    """
+    Async counterpart of HumanBehavior.
+
+    Pauses use asyncio.sleep, so several pages driven from one event loop
+    overlap their camouflage delays instead of blocking each other.
+    """
+
+    def __init__(self, page: "Page", simulate: bool = Settings.HUMAN_SIMULATION_MODE != "never"):
+        """
+        Initialize AsyncHumanBehavior with a Playwright async page.
+
+        Args:
+            page: Playwright async Page object
+            simulate: If False, skip the camouflage pauses between actions
+        """
+        self.page = page
+        self.simulate = simulate
+        # Last known mouse position (None until the first move), so paths start where the cursor is
+        self._mouse: tuple[float, float] | None = None
+        self._viewport: dict | None = None
+        # Dedicated generator, so per-step draws avoid the shared module-level one
+        self._rng = random.Random()
+        # page.mouse.move bound once, for the per-step loops
+        self._move = page.mouse.move
+
+    async def _pause(self, min_s: float, max_s: float) -> None:
+        """Sleep for a random camouflage pause, unless simulation is disabled."""
+        if self.simulate:
+            await asyncio.sleep(self._rng.uniform(min_s, max_s))
+
+    async def random_delay(
+        self,
+        min_ms: int | None = None,
+        max_ms: int | None = None
+    ) -> None:
+        """
+        Wait for a random duration to simulate human timing.
+
+        Args:
+            min_ms: Minimum delay in milliseconds
+            max_ms: Maximum delay in milliseconds
+        """
+        if not self.simulate:
+            return
+        min_delay = min_ms or Settings.MIN_ACTION_DELAY
+        max_delay = max_ms or Settings.MAX_ACTION_DELAY
+        await asyncio.sleep(self._rng.randint(min_delay, max_delay) / 1000)
+
+    # Pure-computation helpers (no browser I/O), shared with the sync implementation
+    _plan_move = HumanBehavior._plan_move
+    _trajectory = HumanBehavior._trajectory
+    _typing_runs = HumanBehavior._typing_runs
+
+    async def mouse_move(self, x: float, y: float) -> None:
+        """
+        Move mouse to coordinates with human-like motion.
+
+        Args:
+            x: Target X coordinate
+            y: Target Y coordinate
+        """
+        points, delays = self._plan_move(x, y)
+
+        move = self._move
+        for (intermediate_x, intermediate_y), delay in zip(points, delays):
+            await move(intermediate_x, intermediate_y)
+            if delay:
+                await asyncio.sleep(delay)
+        self._mouse = points[-1]
+
+    async def click_at(self, x: float, y: float) -> None:
+        """
+        Click at specific coordinates with human-like behavior.
+
+        Args:
+            x: X coordinate to click
+            y: Y coordinate to click
+        """
+        await self.mouse_move(x, y)
+        await self._pause(0.1, 0.3)
+        await self.page.mouse.click(x, y)
+        self._mouse = (x, y)
+
+    async def hold_at(self, x: float, y: float, duration: float | None = None) -> None:
+        """
+        Press and hold at specific coordinates with human-like behavior.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            duration: Hold duration in seconds (randomized 2-4s if not specified)
+        """
+        await self.mouse_move(x, y)
+        await self._pause(0.1, 0.3)
+        hold_time = duration or self._rng.uniform(2.0, 4.0)
+        await self.page.mouse.down()
+        await asyncio.sleep(hold_time)
+        await self.page.mouse.up()
+
+    async def click_box(
+        self,
+        box: BoundingBox,
+        hold: bool = False,
+        hold_duration: float | None = None
+    ) -> None:
+        """
+        Click or hold within a bounding box with human-like behavior.
+
+        Args:
+            box: Bounding box with x, y, width, height
+            hold: If True, press and hold instead of click
+            hold_duration: Hold duration in seconds (used only if hold=True)
+        """
+        randint = self._rng.randint
+        x = box["x"] + box["width"] / 2 + randint(-3, 3)
+        y = box["y"] + box["height"] / 2 + randint(-3, 3)
+
+        if hold:
+            await self.hold_at(x, y, hold_duration)
+        else:
+            await self.click_at(x, y)
+
+    async def click(self, selector: str) -> None:
+        """
+        Click an element with human-like behavior.
+
+        Args:
+            selector: CSS selector for the element to click
+        """
+        element = self.page.locator(selector)
+        bounding_box: BoundingBox | None = await element.bounding_box()
+
+        if bounding_box:
+            await self.click_box(bounding_box)
+        else:
+            await element.click()
+
+        await self.random_delay()
+
+    async def drag(self, start_box: BoundingBox, end_x: float, end_y: float | None = None) -> None:
+        """
+        Perform a human-like drag operation.
+
+        Args:
+            start_box: Bounding box of the element to drag from (center is calculated)
+            end_x: Ending X coordinate
+            end_y: Ending Y coordinate (defaults to start_y for horizontal drag)
+        """
+        start_x = start_box["x"] + start_box["width"] / 2
+        start_y = start_box["y"] + start_box["height"] / 2
+
+        if end_y is None:
+            end_y = start_y
+
+        # Move to start position
+        await self.mouse_move(start_x, start_y)
+        await self._pause(0.1, 0.3)
+
+        # Press mouse button
+        await self.page.mouse.down()
+        await self._pause(0.05, 0.15)
+
+        # Drag in a few slightly wobbling segments, each interpolated by Playwright (steps=)
+        rng = self._rng
+        segments = rng.randint(3, 4)
+        for i in range(1, segments + 1):
+            progress = i / segments
+            wobble = rng.uniform(-3, 3) if i < segments else 0
+            await self._move(
+                start_x + (end_x - start_x) * progress,
+                start_y + (end_y - start_y) * progress + wobble,
+                steps=rng.randint(5, 8)
+            )
+        self._mouse = (end_x, end_y)
+        await self._pause(0.05, 0.15)
+
+        # Release mouse button
+        await self.page.mouse.up()
+
+    async def human_type(self, selector: str, text: str) -> None:
+        """
+        Type text with human-like timing.
+
+        Args:
+            selector: CSS selector for the input element
+            text: Text to type
+        """
+        element = self.page.locator(selector)
+        await element.click()
+        await self.random_delay(200, 500)
+
+        # One call per run of characters; only the thinking pauses between runs cost extra calls
+        for index, run in enumerate(self._typing_runs(text)):
+            if index:
+                await self.random_delay(200, 600)
+            await element.press_sequentially(run, delay=self._rng.randint(80, 120))
+
+    async def wait_for_ready(self, timeout: int = 5000) -> None:
+        """
+        Wait for page to be ready after an action.
+
+        Args:
+            timeout: Maximum wait time in milliseconds
+        """
+        try:
+            await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        except Exception:
+            pass
@@ -1,11 +1,18 @@
 """OpenAI API integration for extracting data from screenshots."""
 
+import asyncio
 import base64
+import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from textwrap import dedent
+from weakref import WeakKeyDictionary
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+from PIL import Image
 
 from config import Settings
 
@@ -13,6 +20,68 @@ from config import Settings
 class OpenAIExtractor:
     """Extracts structured data from images using OpenAI Vision API."""
 
+    # Identical on every request so OpenAI's automatic prompt caching can reuse the prefix
+    SYSTEM_PROMPT = (
+        "You are an e-commerce product data extraction specialist. "
+        "Your task is to identify and extract information about the MAIN product "
+        "on product detail pages. Focus on the product with the largest image "
+        "and whose name appears in the page heading. Ignore small thumbnails in "
+        "'shop similar' or 'recommended' carousels. "
+        "You MUST always provide extracted data - use your best judgment for "
+        "unusual layouts like resale marketplaces (GOAT, StockX) where prices "
+        "may be shown per size or as 'Lowest Ask'."
+    )
+
+    # Built once and shared by every request (the SDK only reads it)
+    _SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+    # Product extraction instructions, dedented once at import
+    PRODUCT_PROMPT = dedent("""
+        Extract product information from the MAIN PRODUCT on this e-commerce page.
+
+        IDENTIFYING THE MAIN PRODUCT:
+        The main product is the one being sold on this page. Look for:
+        - The product name in the page title or largest heading
+        - The largest product image (usually left or center of the page)
+        - The product with detailed description, size selector, or "Add to Cart" button
+
+        DO NOT extract from these secondary sections:
+        - "Shop similar" / "Similar products" horizontal carousels
+        - "You may also like" / "Recommended" sections
+        - Small product thumbnails in rows at the top of the page
+
+        HANDLING DIFFERENT PRICE FORMATS:
+        - Standard: Look for a single price near the product name
+        - Resale sites (StockX, GOAT): Look for "Lowest Ask", "Buy Now" price, or the starting price shown. If prices vary by size, use the lowest visible price or the one currently selected
+        - Auction/bid sites: Use the "Buy Now" or "Lowest Ask" price, not bids
+        - Pre-owned/Refurbished (Walmart, Amazon): The main product may show "Pre-Owned" or "Refurbished" - this is still the main product if it has the largest image
+
+        ALWAYS EXTRACT DATA - even if the layout is unusual, identify the main product and extract what you can find.
+
+        Extract these details:
+        1. Product name/title (the full name from the heading, not abbreviated)
+        2. Original price (if shown crossed out, otherwise N/A)
+        3. Sale/current price (the price to pay now - use lowest available if multiple sizes shown)
+        4. Currency (USD, EUR, GBP, etc.)
+        5. Discount percentage (if shown, otherwise N/A)
+
+        Return the data in this exact format:
+        PRODUCT_NAME: <value>
+        ORIGINAL_PRICE: <value or N/A>
+        SALE_PRICE: <value or N/A>
+        CURRENCY: <value>
+        DISCOUNT_PERCENT: <value or N/A>
+    """).strip()
+
+    # Numeric part of a price (handles formats like "27.77", "1,234.56", "EUR 19.43")
+    _PRICE_RE = re.compile(r'[\d,]+\.?\d*')
+
+    # Largest width or height the WebP format can store
+    WEBP_MAX_DIMENSION = 16383
+
+    # Sync clients per API key, shared by every extractor so their connection pools are reused
+    _clients: dict[str, OpenAI] = {}
+
     def __init__(self, api_key: str = Settings.OPENAI_API_KEY):
         """
         Initialize OpenAI extractor.
@@ -23,17 +92,81 @@ class OpenAIExtractor:
         self.api_key = api_key
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
-        self.client = OpenAI(api_key=self.api_key)
+        if self.api_key not in self._clients:
+            self._clients[self.api_key] = OpenAI(api_key=self.api_key)
+        self.client = self._clients[self.api_key]
         self.model = Settings.OPENAI_MODEL
+        # Async clients per event loop: their connection pools cannot outlive the loop they were opened on
+        self._async_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = WeakKeyDictionary()
+
+    def _encode_image(self, image_path: Path | bytes) -> tuple[str, str]:
+        """
+        Encode image (file path or raw bytes) to base64 string.
+
+        Screenshots are re-encoded to Settings.EXTRACTION_IMAGE_FORMAT first:
+        lossy WebP/JPEG is several times smaller than PNG, which shrinks the
+        upload with no visible effect on text recognition.
+
+        Returns:
+            Tuple of (base64 data, MIME type)
+        """
+        fmt = Settings.EXTRACTION_IMAGE_FORMAT
+        if fmt == "original":
+            data = image_path if isinstance(image_path, bytes) else Path(image_path).read_bytes()
+            mime_type = "image/jpeg" if data[:2] == b"\xff\xd8" else "image/png"
+            return base64.b64encode(data).decode("ascii"), mime_type
+
+        # Pillow reads the file itself instead of from a full in-memory copy of it
+        source = BytesIO(image_path) if isinstance(image_path, bytes) else image_path
+        with Image.open(source) as img:
+            buffer = BytesIO()
+            # WebP cannot hold images over 16383 px per side (long full-page screenshots): use JPEG instead
+            if fmt == "webp" and max(img.size) > self.WEBP_MAX_DIMENSION:
+                fmt = "jpeg"
+            if fmt == "jpeg":
+                img.convert("RGB").save(buffer, format="JPEG", quality=Settings.EXTRACTION_IMAGE_QUALITY)
+            else:
+                img.save(buffer, format="WEBP", quality=Settings.EXTRACTION_IMAGE_QUALITY, method=4)
+
+        # Encode from the buffer's memory directly instead of a getvalue() copy
+        return base64.b64encode(buffer.getbuffer()).decode("ascii"), f"image/{fmt}"
+
+    def _build_messages(
+        self,
+        base64_image: str,
+        mime_type: str,
+        prompt: str,
+        additional_context: str | None = None
+    ) -> list[dict]:
+        """Build the chat messages for one encoded image (shared by the sync and async paths)."""
+        # Per-call content goes last so the shared prefix stays byte-identical
+        content = [
+            {
+                "type": "text",
+                "text": prompt
+            },
+            {
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:{mime_type};base64,{base64_image}",
+                    "detail": "high"
+                }
+            }
+        ]
+        if additional_context:
+            content.append({"type": "text", "text": f"Context: {additional_context}"})
 
-    def _encode_image(self, image_path: Path) -> str:
-        """Encode image to base64 string."""
-        with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode("utf-8")
+        return [
+            self._SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": content
+            }
+        ]
 
     def extract_data(
         self,
-        image_path: Path,
+        image_path: Path | bytes,
         prompt: str,
         additional_context: str | None = None
     ) -> str:
@@ -41,49 +174,14 @@ class OpenAIExtractor:
         Extract data from an image using OpenAI Vision.
 
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or the raw image bytes
             prompt: Extraction prompt describing what data to extract
             additional_context: Optional additional context for the extraction
 
         Returns:
             Extracted data as a string
         """
-        base64_image = self._encode_image(image_path)
-
-        if additional_context:
-            prompt = f"{prompt}\n\nContext: {additional_context}"
-
-        messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are an e-commerce product data extraction specialist. "
-                    "Your task is to identify and extract information about the MAIN product "
-                    "on product detail pages. Focus on the product with the largest image "
-                    "and whose name appears in the page heading. Ignore small thumbnails in "
-                    "'shop similar' or 'recommended' carousels. "
-                    "You MUST always provide extracted data - use your best judgment for "
-                    "unusual layouts like resale marketplaces (GOAT, StockX) where prices "
-                    "may be shown per size or as 'Lowest Ask'."
-                )
-            },
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": prompt
-                    },
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:image/png;base64,{base64_image}",
-                            "detail": "high"
-                        }
-                    }
-                ]
-            }
-        ]
+        messages = self._build_messages(*self._encode_image(image_path), prompt, additional_context)
 
         response = self.client.chat.completions.create(
             model=self.model,
@@ -93,54 +191,148 @@ class OpenAIExtractor:
 
         return response.choices[0].message.content or ""
 
-    def extract_product_info(self, image_path: Path) -> dict:
+    def extract_product_info(self, image_path: Path | bytes) -> dict:
         """
         Extract product information from a screenshot.
 
         Args:
-            image_path: Path to the product screenshot
+            image_path: Path to the product screenshot, or the raw image bytes
 
         Returns:
             Dictionary with product information
         """
-        prompt = dedent("""
-            Extract product information from the MAIN PRODUCT on this e-commerce page.
-
-            IDENTIFYING THE MAIN PRODUCT:
-            The main product is the one being sold on this page. Look for:
-            - The product name in the page title or largest heading
-            - The largest product image (usually left or center of the page)
-            - The product with detailed description, size selector, or "Add to Cart" button
-
-            DO NOT extract from these secondary sections:
-            - "Shop similar" / "Similar products" horizontal carousels
-            - "You may also like" / "Recommended" sections
-            - Small product thumbnails in rows at the top of the page
-
-            HANDLING DIFFERENT PRICE FORMATS:
-            - Standard: Look for a single price near the product name
-            - Resale sites (StockX, GOAT): Look for "Lowest Ask", "Buy Now" price, or the starting price shown. If prices vary by size, use the lowest visible price or the one currently selected
-            - Auction/bid sites: Use the "Buy Now" or "Lowest Ask" price, not bids
-            - Pre-owned/Refurbished (Walmart, Amazon): The main product may show "Pre-Owned" or "Refurbished" - this is still the main product if it has the largest image
-
-            ALWAYS EXTRACT DATA - even if the layout is unusual, identify the main product and extract what you can find.
-
-            Extract these details:
-            1. Product name/title (the full name from the heading, not abbreviated)
-            2. Original price (if shown crossed out, otherwise N/A)
-            3. Sale/current price (the price to pay now - use lowest available if multiple sizes shown)
-            4. Currency (USD, EUR, GBP, etc.)
-            5. Discount percentage (if shown, otherwise N/A)
-
-            Return the data in this exact format:
-            PRODUCT_NAME: <value>
-            ORIGINAL_PRICE: <value or N/A>
-            SALE_PRICE: <value or N/A>
-            CURRENCY: <value>
-            DISCOUNT_PERCENT: <value or N/A>
-        """).strip()
-
-        response = self.extract_data(image_path, prompt)
+        response = self.extract_data(image_path, self.PRODUCT_PROMPT)
+        return self._parse_product_response(response)
+
+    def extract_product_info_batch(self, image_paths: list[Path | bytes], max_workers: int = 10) -> list[dict]:
+        """
+        Extract product information from several screenshots concurrently.
+
+        Requests are I/O-bound, so running them on a thread pool turns N
+        sequential round-trips into roughly N / max_workers.
+
+        Args:
+            image_paths: Paths to the product screenshots (or raw image bytes)
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Product information dictionaries, in input order
+        """
+        if not image_paths:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(image_paths))) as executor:
+            return list(executor.map(self.extract_product_info, image_paths))
+
+    def extract_product_info_batch_api(self, image_paths: list[Path | bytes], poll_interval: float = 30.0) -> list[dict]:
+        """
+        Extract product information through the OpenAI Batch API.
+
+        All requests are uploaded as one JSONL file and processed asynchronously
+        by OpenAI at a reduced token price. Results can take minutes to hours, so
+        this suits large offline runs rather than interactive use.
+
+        Args:
+            image_paths: Paths to the product screenshots (or raw image bytes)
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Product information dictionaries, in input order (all fields None for failed requests)
+        """
+        if not image_paths:
+            return []
+
+        lines = [
+            json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._build_messages(*self._encode_image(image_path), self.PRODUCT_PROMPT),
+                    "max_tokens": 1000
+                }
+            })
+            for index, image_path in enumerate(image_paths)
+        ]
+        input_file = self.client.files.create(
+            file=("product_extraction.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        responses = [""] * len(image_paths)
+        if batch.output_file_id:
+            for line in self.client.files.content(batch.output_file_id).text.splitlines():
+                record = json.loads(line)
+                choices = ((record.get("response") or {}).get("body") or {}).get("choices")
+                if choices:
+                    responses[int(record["custom_id"])] = choices[0]["message"]["content"] or ""
+
+        return [self._parse_product_response(response) for response in responses]
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async OpenAI client for the running event loop, created on first use by the *_async methods."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = AsyncOpenAI(api_key=self.api_key)
+        return client
+
+    async def aclose(self) -> None:
+        """Close the running event loop's async client, if one was created (call before the loop ends)."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    async def extract_data_async(
+        self,
+        image_path: Path | bytes,
+        prompt: str,
+        additional_context: str | None = None
+    ) -> str:
+        """
+        Async variant of extract_data, for callers running on an event loop.
+
+        Image reading and re-encoding run in a worker thread, and the request goes
+        through AsyncOpenAI, so concurrent extractions never block the loop.
+
+        Args:
+            image_path: Path to the image file, or the raw image bytes
+            prompt: Extraction prompt describing what data to extract
+            additional_context: Optional additional context for the extraction
+
+        Returns:
+            Extracted data as a string
+        """
+        encoded = await asyncio.to_thread(self._encode_image, image_path)
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(*encoded, prompt, additional_context),
+            max_tokens=1000
+        )
+
+        return response.choices[0].message.content or ""
+
+    async def extract_product_info_async(self, image_path: Path | bytes) -> dict:
+        """
+        Async variant of extract_product_info.
+
+        Args:
+            image_path: Path to the product screenshot, or the raw image bytes
+
+        Returns:
+            Dictionary with product information
+        """
+        response = await self.extract_data_async(image_path, self.PRODUCT_PROMPT)
         return self._parse_product_response(response)
 
     def _parse_product_response(self, response: str) -> dict:
@@ -154,22 +346,17 @@ class OpenAIExtractor:
             "raw_response": response
         }
 
-        lines = response.strip().split("\n")
-        for line in lines:
-            if ":" in line:
-                key, value = line.split(":", 1)
-                key = key.strip().lower().replace(" ", "_")
-                value = value.strip()
+        for line in response.strip().split("\n"):
+            key, separator, value = line.partition(":")
+            if not separator:
+                continue
+            key = key.strip().lower().replace(" ", "_")
+            parser = self._FIELD_PARSERS.get(key)
+            if parser is None:
+                continue
 
-                if value.upper() == "N/A":
-                    value = None
-
-                if key in ["product_name", "currency"]:
-                    result[key] = value
-                elif key in ["original_price", "sale_price"]:
-                    result[key] = self._parse_price(value)
-                elif key == "discount_percent":
-                    result["discount_percent"] = self._parse_percentage(value)
+            value = value.strip()
+            result[key] = parser(self, None if value.upper() == "N/A" else value)
 
         return result
 
@@ -178,8 +365,7 @@ class OpenAIExtractor:
         if not value:
             return None
         try:
-            # Extract the numeric part (handles formats like "27.77", "1,234.56", "EUR 19.43")
-            match = re.search(r'[\d,]+\.?\d*', value)
+            match = self._PRICE_RE.search(value)
             if match:
                 number_str = match.group().replace(",", ".")
                 return float(number_str)
@@ -197,6 +383,15 @@ class OpenAIExtractor:
         except (ValueError, AttributeError):
             return None
 
+    # Parser per response field, called as parser(self, value); other fields are ignored
+    _FIELD_PARSERS = {
+        "product_name": lambda self, value: value,
+        "currency": lambda self, value: value,
+        "original_price": _parse_price,
+        "sale_price": _parse_price,
+        "discount_percent": _parse_percentage,
+    }
+
     def calculate_final_price(self, product_info: dict) -> float | None:
         """
         Calculate the final sale price from extracted product info.
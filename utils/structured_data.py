@@ -0,0 +1,163 @@
+"""Product data extraction from schema.org JSON-LD blocks."""
+
+import json
+from urllib.parse import urljoin, urlsplit
+
+# Offer price specifications describing the undiscounted price
+_LIST_PRICE_TYPES = ("ListPrice", "StrikethroughPrice")
+
+
+def _iter_nodes(data):
+    """Yield every JSON-LD node, flattening lists and @graph containers."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_nodes(data["@graph"])
+
+
+def _as_list(value) -> list:
+    """Wrap a single JSON-LD value in a list (lists are returned unchanged)."""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _is_product(node: dict) -> bool:
+    """Check whether a JSON-LD node is a schema.org Product."""
+    return "Product" in _as_list(node.get("@type"))
+
+
+def _to_float(value) -> float | None:
+    """Convert a JSON-LD price value to float."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            return None
+    return None
+
+
+def _normalize_url(url, base: str) -> str | None:
+    """Reduce a (possibly relative) URL to host + path + query for comparisons."""
+    if not isinstance(url, str) or not url.strip():
+        return None
+    parts = urlsplit(urljoin(base, url.strip()))
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}?{parts.query}"
+
+
+def _offer_price(offer: dict) -> float | None:
+    """
+    Price of an offer; an AggregateOffer only counts when its price range is a single value.
+
+    Zero or negative prices are placeholders ("price on request", out of stock) and count as missing.
+    """
+    price = _to_float(offer.get("price"))
+    if price is None:
+        low, high = _to_float(offer.get("lowPrice")), _to_float(offer.get("highPrice"))
+        price = low if high is None or high == low else None
+    return price if price is not None and price > 0 else None
+
+
+def _list_price(offer: dict) -> float | None:
+    """Undiscounted price from the offer's ListPrice/StrikethroughPrice specification, if any."""
+    for spec in _as_list(offer.get("priceSpecification")):
+        if isinstance(spec, dict) and str(spec.get("priceType", "")).endswith(_LIST_PRICE_TYPES):
+            return _to_float(spec.get("price"))
+    return None
+
+
+def _select_offer(offers: list[dict], page_urls: set[str], base: str) -> dict | None:
+    """
+    Pick the offer sold on this page.
+
+    An offer whose url matches the page wins; otherwise the offers must all
+    share one price, since picking among differently priced variants would be a guess.
+    """
+    priced = [offer for offer in offers if _offer_price(offer) is not None]
+    for offer in priced:
+        if _normalize_url(offer.get("url"), base) in page_urls:
+            return offer
+    if priced and len({_offer_price(offer) for offer in priced}) == 1:
+        return priced[0]
+    return None
+
+
+def _find_product(blocks: list[str], page_urls: set[str], base: str) -> tuple[dict, list[dict], str] | None:
+    """
+    Find the Product node describing this page.
+
+    A Product whose url (or one of its offers' url) matches the page wins;
+    otherwise a lone Product is used. Several unmatched Products (e.g. related
+    items) are ambiguous.
+
+    Returns:
+        Tuple of (product node, its offers, source block), or None if no Product can be chosen
+    """
+    products = []
+    for block in blocks:
+        try:
+            data = json.loads(block)
+        except ValueError:
+            continue
+
+        for node in _iter_nodes(data):
+            if not _is_product(node):
+                continue
+            offers = [offer for offer in _as_list(node.get("offers")) if isinstance(offer, dict)]
+            urls = [node.get("url")] + [offer.get("url") for offer in offers]
+            if any(_normalize_url(url, base) in page_urls for url in urls):
+                return node, offers, block
+            products.append((node, offers, block))
+
+    return products[0] if len(products) == 1 else None
+
+
+def extract_product_from_json_ld(blocks: list[str], page_urls: list[str | None] | None = None) -> dict | None:
+    """
+    Build product information from schema.org Product JSON-LD.
+
+    Many e-commerce pages embed their name, price and currency as structured
+    data; when present, it makes the vision extraction unnecessary.
+
+    Args:
+        blocks: Text content of the page's application/ld+json scripts
+        page_urls: URLs identifying the page (current and canonical URL), used to
+            pick the matching product and offer; the first one resolves relative URLs
+
+    Returns:
+        Dictionary shaped like OpenAIExtractor.extract_product_info, or None if
+        no Product with an unambiguous offer price was found
+    """
+    base = next((url for url in page_urls or () if url), "")
+    normalized = (_normalize_url(url, base) for url in page_urls or ())
+    wanted = {url for url in normalized if url}
+
+    product = _find_product(blocks, wanted, base)
+    if product is None:
+        return None
+    node, offers, block = product
+    offer = _select_offer(offers, wanted, base)
+    if offer is None:
+        return None
+
+    sale_price = _offer_price(offer)
+    if sale_price is None:
+        return None
+    original_price = _list_price(offer)
+    if original_price is not None and original_price <= sale_price:
+        original_price = None
+    discount = round((1 - sale_price / original_price) * 100, 2) if original_price else None
+
+    return {
+        "product_name": node.get("name"),
+        "original_price": original_price,
+        "sale_price": sale_price,
+        "currency": offer.get("priceCurrency"),
+        "discount_percent": discount,
+        "raw_response": block
+    }
@@ -40,17 +40,9 @@ class TextReader:
         Returns:
             List of unique URLs found in the file
         """
-        urls = set()
-
+        # Drop comment lines, then scan the remaining text in a single regex pass
+        # (URLs never span lines, so joining them cannot create false matches)
         with open(self.file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    # Skip empty lines and comments
-                    continue
-
-                # Try to match URLs in the line
-                found_urls = self.URL_PATTERN.findall(line)
-                urls.update(found_urls)
+            text = "".join(line for line in f if not line.lstrip().startswith("#"))
 
-        return list(urls)
+        return list({match.group(0) for match in self.URL_PATTERN.finditer(text)})
@@ -1,8 +1,35 @@
 """Word document reader utility for extracting URLs."""
 
 import re
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
 from docx import Document
+from docx.oxml.ns import qn
+
+if TYPE_CHECKING:
+    from docx.document import Document as DocxDocument
+
+
+# Run children contributing to a paragraph's text, mapped like python-docx's Paragraph.text
+_RUN = qn("w:r")
+_TEXT = qn("w:t")
+_RUN_SEPARATORS = {qn("w:tab"): "\t", qn("w:br"): "\n", qn("w:cr"): "\n"}
+
+
+def _element_text(element) -> str:
+    """
+    Text of a paragraph (or hyperlink) element, in document order.
+
+    Tabs and line breaks become whitespace so that URLs they separate stay apart.
+    """
+    parts = []
+    for node in element.iter(_TEXT, *_RUN_SEPARATORS):
+        if node.getparent().tag != _RUN:
+            # e.g. tab stop definitions in the paragraph properties
+            continue
+        parts.append((node.text or "") if node.tag == _TEXT else _RUN_SEPARATORS[node.tag])
+    return "".join(parts)
 
 
 class WordReader:
@@ -30,6 +57,11 @@ class WordReader:
         if self.file_path.suffix.lower() != ".docx":
             raise ValueError(f"Expected .docx file, got: {self.file_path.suffix}")
 
+    @cached_property
+    def document(self) -> "DocxDocument":
+        """Parsed document, loaded once and shared by every extraction method."""
+        return Document(self.file_path)
+
     def extract_urls(self) -> list[str]:
         """
         Extract all URLs from the Word document.
@@ -37,25 +69,31 @@ class WordReader:
         Returns:
             List of unique URLs found in the document
         """
-        document = Document(self.file_path)
+        document = self.document
+        rels = document.part.rels
         urls = set()
+        texts = []
 
-        # Extract from paragraphs
-        for paragraph in document.paragraphs:
-            text = paragraph.text.strip()
-            if not text or text.startswith("#"):
+        # One lxml pass over every paragraph, table cells included
+        for paragraph in document.element.body.iter(qn("w:p")):
+            text = _element_text(paragraph)
+            if text.lstrip().startswith("#"):
+                # Skip comment paragraphs, hyperlinks included
                 continue
-            found_urls = self.URL_PATTERN.findall(text)
-            urls.update(found_urls)
-
-        # Extract from tables
-        for table in document.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    text = cell.text.strip()
-                    if not text or text.startswith("#"):
-                        continue
-                    found_urls = self.URL_PATTERN.findall(text)
-                    urls.update(found_urls) 
+            texts.append(text)
+
+            # Hyperlinks whose visible text is not a URL (e.g. "see product") contribute their target;
+            # typed URLs that Word auto-linked are found by the text scan below, as typed
+            for hyperlink in paragraph.iter(qn("w:hyperlink")):
+                rel = rels.get(hyperlink.get(qn("r:id")))
+                if (
+                    rel is not None and rel.is_external
+                    and rel.target_ref.startswith(("http://", "https://"))
+                    and not self.URL_PATTERN.search(_element_text(hyperlink))
+                ):
+                    urls.add(rel.target_ref)
+
+        # Bare URLs typed as text, in a single regex pass
+        urls.update(match.group(0) for match in self.URL_PATTERN.finditer("\n".join(texts)))
 
         return list(urls)